@@ -1,8 +1,25 @@
 import importlib
 import subprocess
+import os
+import sys
+import time
 from datetime import datetime
 
+_module_load_started = time.perf_counter()
+_import_timings = {}
+
+# Set DATA_UTILS_AUTO_INSTALL=0 to stop missing libraries from being pip installed at runtime
+AUTO_INSTALL_PACKAGES = os.environ.get("DATA_UTILS_AUTO_INSTALL", "1").strip().lower() not in ("0", "false", "no", "off")
+# Set DATA_UTILS_EAGER_IMPORTS=1 to resolve every lazy import while the module loads
+EAGER_IMPORTS = os.environ.get("DATA_UTILS_EAGER_IMPORTS", "0").strip().lower() in ("1", "true", "yes", "on")
+
+
 def install_package(pip_name):
+    if not pip_name:
+        return False
+    if not AUTO_INSTALL_PACKAGES:
+        log_message(f"[WARNING] Missing library {pip_name}. Runtime installs are disabled (AUTO_INSTALL_PACKAGES=False).")
+        return False
     try:
         log_message(f"[INFO] Missing library. Installing: {pip_name}...")
         subprocess.check_call([sys.executable, "-m", "pip", "install", pip_name])
@@ -37,138 +54,191 @@ def log_message(message, file_path='log.txt'):
     write_file(file_path, log_entry)
 
 
+def import_object(fr_mod, im_mod=None, pip_name=None, name=None):
+    name = name or im_mod or fr_mod
+    start = time.perf_counter()
+    for attempt in range(2):
+        try:
+            obj = importlib.import_module(fr_mod)
+            if im_mod is not None:
+                obj = getattr(obj, im_mod)
+            _import_timings[name] = {'module': fr_mod, 'status': 'loaded', 'seconds': time.perf_counter() - start}
+            return obj
+        except Exception as e:
+            log_message(f'[ERROR] Failed to import {im_mod + " from " if im_mod else ""}{fr_mod}: {str(e)}')
+            if attempt == 0 and install_package(pip_name):
+                continue
+            break
+    _import_timings[name] = {'module': fr_mod, 'status': 'failed', 'seconds': time.perf_counter() - start}
+    return None
+
+
 modules = [
     # Format: (module, pip_install_name)
-    ("os", "os"),
     ("time", "time"),
     ("warnings", "warnings"),
     ("io", "io"),
     ("csv", "csv"),
     ("re", "re"),
     ("json", "json"),
-    ("sys", "sys"),
     ("ftplib", "ftplib"),
     ("ast", "ast"),
-    ("winsound", "winsound"),
     ("base64", "base64"),
     ("inspect", "inspect"),
     ("requests", "requests"),
     ("boto3", "boto3"),
     ("pytz", "pytz"),
-    ("pyodbc", "pyodbc"),
-    ("psycopg2", "psycopg2"),
-    ("pandas_gbq", "pandas-gbq"),
     ("importlib.util", "importlib"),
     ("botocore", "boto3"),
-    ("serial", "pyserial"),
-    ("esptool", "esptool"),
-    ("recordlinkage", "recordlinkage"),
     ("gc", "gc"),
-    ("nltk", "nltk"),
-    ("itertools", "itertools")
+    ("itertools", "itertools"),
+    ("tempfile", "tempfile"),
+    ("shutil", "shutil"),
+    ("codecs", "codecs"),
+    ("mmap", "mmap"),
+    ("threading", "threading"),
+    ("queue", "queue"),
+    ("random", "random"),
+    ("bisect", "bisect")
 ]
 for mod, pip_name in modules:
-    for attempt in range(2):
-        try:
-            globals()[mod] = importlib.import_module(mod)
-            break
-        except Exception as e:
-            log_message(f'[ERROR] Failed to import {mod}: {str(e)}')
-            if install_package(pip_name):
-                globals()[mod] = importlib.import_module(mod)
+    obj = import_object(mod, pip_name=pip_name)
+    if obj is not None:
+        globals()[mod] = obj
 
 modules = [
     # Format: (module, object_to_import, pip_install_name)
     ("datetime", "date", "datetime"),
     ("datetime", "timedelta", "datetime"),
     ("datetime", "datetime", "datetime"),
-    ("requests_oauthlib", "OAuth1", "requests-oauthlib"),
     ("tqdm", "tqdm", "tqdm"),
-    ("googleapiclient.discovery", "build", "google-api-python-client"),
-    ("googleapiclient.errors", "HttpError", "google-api-python-client"),
-    ("google.oauth2", "service_account", "google-cloud-bigquery"),
-    ("google.cloud", "bigquery", "google-cloud-bigquery"),
     ("requests.auth", "HTTPBasicAuth", "requests"),
-    ("webdriver_manager.chrome", "ChromeDriverManager", "webdriver-manager"),
-    ("selenium.webdriver.common.by", "By", "selenium"),
-    ("selenium.webdriver.common.keys", "Keys", "selenium"),
-    ("selenium.webdriver.support.ui", "WebDriverWait", "selenium"),
-    ("bs4", "BeautifulSoup", "beautifulsoup4"),
-    ("sklearn.feature_extraction.text", "TfidfVectorizer", "scikit-learn"),
-    ("sklearn.multioutput", "MultiOutputClassifier", "scikit-learn"),
-    ("sklearn.ensemble", "RandomForestClassifier", "scikit-learn"),
-    ("sklearn.preprocessing", "LabelEncoder", "scikit-learn"),
-    ("sklearn.model_selection", "train_test_split", "scikit-learn"),
-    ("sklearn.metrics", "accuracy_score", "scikit-learn"),
-    ("psycopg2.errors", "DuplicateObject", "psycopg2"),
-    ("psycopg2.errors", "UndefinedTable", "psycopg2"),
     ("itertools", "islice", "itertools"),
-    ("intuitlib.client", "AuthClient", "intuit-oauth"),
-    ("intuitlib.enums", "Scopes", "intuit-oauth"),
+    ("requests.adapters", "HTTPAdapter", "requests"),
+    ("urllib3.util.retry", "Retry", "requests"),
     ("urllib.parse", "urlparse", None),
     ("urllib.parse", "parse_qs", None),
     ("collections", "Counter", None),
+    ("collections", "deque", None),
+    ("concurrent.futures", "ThreadPoolExecutor", None),
+    ("concurrent.futures", "as_completed", None),
     ("pandas.api.types", "is_numeric_dtype", None),
     ("typing", "List", "typing"),
     ("typing", "Dict", "typing"),
     ("typing", "Tuple", "typing"),
 ]
-
 for fr_mod, im_mod, pip_name in modules:
-    for attempt in range(2):
-        try:
-            mod = importlib.import_module(fr_mod)
-            obj = getattr(mod, im_mod)
-            globals()[im_mod] = obj
-            break
-        except Exception as e:
-            log_message(f'[ERROR] Failed to import {im_mod} from {fr_mod}: {str(e)}')
-            if install_package(pip_name) and attempt == 0:
-                continue
-            else:
-                break
+    obj = import_object(fr_mod, im_mod, pip_name)
+    if obj is not None:
+        globals()[im_mod] = obj
 
 modules = [
     # Format: (module, alias, pip_install_name)
     ("pandas", "pd", "pandas"),
+    ("pyarrow", "pa", "pyarrow"),
     ("pyarrow.parquet", "pq", "pyarrow"),
     ("numpy", "np", "numpy"),
-    ("selenium.webdriver.support.expected_conditions", "EC", "selenium"),
-    ("selenium.webdriver", "webdriver", "selenium")
 ]
-
 for mod, alias, pip_name in modules:
-    for attempt in range(2):
-        try:
-            globals()[alias] = importlib.import_module(mod)
-            break
-        except Exception as e:
-            log_message(f'[ERROR] Failed to import {mod} as {alias}: {str(e)}')
-            if install_package(pip_name) and attempt == 0:
-                continue
-            else:
-                break
+    obj = import_object(mod, pip_name=pip_name, name=alias)
+    if obj is not None:
+        globals()[alias] = obj
+
+lazy_modules = {
+    # Format: alias: (module, object_to_import, pip_install_name)
+    # Resolved on first use, so workers that never touch these libraries don't pay for them at load time
+    "winsound": ("winsound", None, None),
+    "pyodbc": ("pyodbc", None, "pyodbc"),
+    "psycopg2": ("psycopg2", None, "psycopg2"),
+    "pandas_gbq": ("pandas_gbq", None, "pandas-gbq"),
+    "serial": ("serial", None, "pyserial"),
+    "esptool": ("esptool", None, "esptool"),
+    "recordlinkage": ("recordlinkage", None, "recordlinkage"),
+    "nltk": ("nltk", None, "nltk"),
+    "OAuth1": ("requests_oauthlib", "OAuth1", "requests-oauthlib"),
+    "build": ("googleapiclient.discovery", "build", "google-api-python-client"),
+    "HttpError": ("googleapiclient.errors", "HttpError", "google-api-python-client"),
+    "service_account": ("google.oauth2", "service_account", "google-cloud-bigquery"),
+    "bigquery": ("google.cloud", "bigquery", "google-cloud-bigquery"),
+    "ChromeDriverManager": ("webdriver_manager.chrome", "ChromeDriverManager", "webdriver-manager"),
+    "By": ("selenium.webdriver.common.by", "By", "selenium"),
+    "Keys": ("selenium.webdriver.common.keys", "Keys", "selenium"),
+    "WebDriverWait": ("selenium.webdriver.support.ui", "WebDriverWait", "selenium"),
+    "EC": ("selenium.webdriver.support.expected_conditions", None, "selenium"),
+    "webdriver": ("selenium.webdriver", None, "selenium"),
+    "ChromeService": ("selenium.webdriver.chrome.service", "Service", "selenium"),
+    "BeautifulSoup": ("bs4", "BeautifulSoup", "beautifulsoup4"),
+    "TfidfVectorizer": ("sklearn.feature_extraction.text", "TfidfVectorizer", "scikit-learn"),
+    "MultiOutputClassifier": ("sklearn.multioutput", "MultiOutputClassifier", "scikit-learn"),
+    "RandomForestClassifier": ("sklearn.ensemble", "RandomForestClassifier", "scikit-learn"),
+    "LabelEncoder": ("sklearn.preprocessing", "LabelEncoder", "scikit-learn"),
+    "train_test_split": ("sklearn.model_selection", "train_test_split", "scikit-learn"),
+    "accuracy_score": ("sklearn.metrics", "accuracy_score", "scikit-learn"),
+    "DuplicateObject": ("psycopg2.errors", "DuplicateObject", "psycopg2"),
+    "UndefinedTable": ("psycopg2.errors", "UndefinedTable", "psycopg2"),
+    "AuthClient": ("intuitlib.client", "AuthClient", "intuit-oauth"),
+    "Scopes": ("intuitlib.enums", "Scopes", "intuit-oauth"),
+}
 
-modules = [
-    # Format: (module, object_to_import, alias, pip_install_name)
-    ("selenium.webdriver.chrome.service", "Service", "ChromeService", "selenium"),
-]
 
-for fr_mod, im_mod, alias, pip_name in modules:
-    for attempt in range(2):
+class _LazyImport:
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, item):
+        if item.startswith('__'):
+            raise AttributeError(item)
+        return getattr(require_modules(self._name), item)
+
+    def __call__(self, *args, **kwargs):
+        return require_modules(self._name)(*args, **kwargs)
+
+    def __repr__(self):
+        return f"<lazy import '{self._name}' from '{lazy_modules[self._name][0]}'>"
+
+
+def require_modules(*names):
+    # Bare names used in `except` clauses or isinstance checks must be resolved up front with this call
+    resolved = []
+    for name in names:
+        obj = globals().get(name)
+        if isinstance(obj, _LazyImport) or obj is None:
+            fr_mod, im_mod, pip_name = lazy_modules[name]
+            obj = import_object(fr_mod, im_mod, pip_name, name=name)
+            if obj is None:
+                raise ImportError(f'Could not import "{name}" from "{fr_mod}". Install "{pip_name or fr_mod}" and try again.')
+            globals()[name] = obj
+            namespace = globals().get('caller_globals')
+            if namespace is not None and isinstance(namespace.get(name), _LazyImport):
+                namespace[name] = obj
+        resolved.append(obj)
+    return resolved[0] if len(resolved) == 1 else resolved
+
+
+def get_import_report():
+    rows = [{'name': name, **info} for name, info in _import_timings.items()]
+    rows += [
+        {'name': name, 'module': lazy_modules[name][0], 'status': 'deferred', 'seconds': 0.0}
+        for name in lazy_modules if name not in _import_timings
+    ]
+    report = pd.DataFrame(rows, columns=['name', 'module', 'status', 'seconds'])
+    report = report.sort_values('seconds', ascending=False).reset_index(drop=True)
+    log_message(f'[INFO] Module loaded in {_module_load_seconds:.3f}s. {(report["status"] == "loaded").sum()} imports loaded, {(report["status"] == "deferred").sum()} deferred, {(report["status"] == "failed").sum()} failed.')
+    return report
+
+
+for name in lazy_modules:
+    globals()[name] = _LazyImport(name)
+if EAGER_IMPORTS:
+    for name in lazy_modules:
         try:
-            fr_mod = importlib.import_module(fr_mod)
-            obj = getattr(fr_mod, im_mod)
-            globals()[alias] = obj
-            break
-        except Exception as e:
-            log_message(f'[ERROR] Failed to import {im_mod} from {fr_mod}: {str(e)}')
-            if install_package(pip_name) and attempt == 0:
-                continue
-            else:
-                break
+            require_modules(name)
+        except ImportError as e:
+            log_message(f'[ERROR] {e}')
+
+_module_load_seconds = time.perf_counter() - _module_load_started
 
-caller_globals = inspect.stack()[1][0].f_globals
+caller_globals = inspect.currentframe().f_back.f_globals
 for name in list(globals()):
     if not name.startswith("_") and name not in ['caller_globals', 'inspect']:
         caller_globals[name] = globals()[name]
@@ -248,54 +318,175 @@ valid_ca_states = {
 }
 
 
+_REPR_TOKEN_PATTERN = re.compile(r"""'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|\bNone\b|\bTrue\b|\bFalse\b""")
+_REPR_KEYWORDS = {'None': 'null', 'True': 'true', 'False': 'false'}
+# orjson turns integers outside int64/uint64 into floats (e.g. -9999999999999999999 -> -1e19); any 19+ digit run can be
+# out of range, so those texts use the stdlib decoder
+_DIGIT_MASK_TABLE = bytes(48 if 48 <= i <= 57 else 46 for i in range(256))
+_LONG_DIGIT_RUN = b'0' * 19
+_json_loads = None
+_nested_parse_stats = {}
+
+
+def _get_json_loads():
+    # orjson is an optional accelerator; without it the standard library decoder is used
+    global _json_loads
+    if _json_loads is None:
+        _json_loads = json.loads
+        if importlib.util.find_spec('orjson') is not None:
+            _json_loads = import_object('orjson', 'loads', name='orjson') or json.loads
+    return _json_loads
+
+
+def _repr_token_to_json(match):
+    token = match.group(0)
+    if token[0] == "'":
+        return '"' + token[1:-1].replace("\\'", "'").replace('"', '\\"') + '"'
+    if token[0] == '"':
+        return token
+    return _REPR_KEYWORDS[token]
+
+
+def _repr_keywords_to_json(text):
+    return text.replace('None', 'null').replace('True', 'true').replace('False', 'false')
+
+
+def _repr_to_json(text):
+    # Rewrites a Python repr of dicts/lists as JSON; anything it cannot express fails to decode and falls back
+    if '"' not in text and '\\' not in text:
+        parts = text.split("'")
+        parts[0::2] = [_repr_keywords_to_json(part) for part in parts[0::2]]
+        return '"'.join(parts)
+    return _REPR_TOKEN_PATTERN.sub(_repr_token_to_json, text)
+
+
+def _detect_nested_encoding(values, sample_size=20):
+    sample = []
+    for value in values:
+        if isinstance(value, str) and value.strip():
+            sample.append(value.strip())
+            if len(sample) >= sample_size:
+                break
+    json_count = repr_count = 0
+    for text in sample:
+        try:
+            json.loads(text)
+            json_count += 1
+            continue
+        except Exception:
+            pass
+        try:
+            json.loads(_repr_to_json(text))
+            repr_count += 1
+        except Exception:
+            pass
+    return 'repr' if repr_count > json_count else 'json'
+
+
+def _positions_with_long_digit_runs(texts):
+    # One translate/find pass over the whole column instead of a regex search per value
+    masked = '\n'.join(texts).encode('utf-8').translate(_DIGIT_MASK_TABLE)
+    position = masked.find(_LONG_DIGIT_RUN)
+    if position == -1:
+        return set()
+    ends = list(itertools.accumulate(len(text.encode('utf-8')) + 1 for text in texts))
+    positions = set()
+    while position != -1:
+        text_position = bisect.bisect_right(ends, position)
+        positions.add(text_position)
+        if text_position >= len(ends):
+            break
+        position = masked.find(_LONG_DIGIT_RUN, ends[text_position])
+    return positions
+
+
+def decode_nested_column(series, col=None, parsed_cache=None):
+    # parsed_cache maps raw cell text to its decoded list so callers flattening the same frame parse each value once
+    col = col or series.name
+    start = time.perf_counter()
+    loads = _get_json_loads()
+    encoding = _detect_nested_encoding(series.values)
+    decoded = [[] for _ in range(len(series))]
+    texts = []
+    raw_texts = []
+    # Positions of every cell holding each distinct raw text, so repeated cells are parsed once
+    text_positions = {}
+    cache_hits = 0
+    for position, value in enumerate(series.values):
+        if isinstance(value, list):
+            decoded[position] = value
+        elif isinstance(value, dict):
+            decoded[position] = [value]
+        elif isinstance(value, str):
+            if parsed_cache is not None and value in parsed_cache:
+                decoded[position] = parsed_cache[value]
+                cache_hits += 1
+                continue
+            if value in text_positions:
+                text_positions[value].append(position)
+                cache_hits += 1
+                continue
+            text = value.strip()
+            if text:
+                texts.append(text)
+                raw_texts.append(value)
+                text_positions[value] = [position]
+    slow_texts = _positions_with_long_digit_runs(texts) if texts and loads is not json.loads else set()
+    errors = 0
+    first_error = None
+    for text_number, (raw_text, text) in enumerate(zip(raw_texts, texts)):
+        positions = text_positions[raw_text]
+        try:
+            text_json = _repr_to_json(text) if encoding == 'repr' else text
+            parsed = json.loads(text_json) if text_number in slow_texts else loads(text_json)
+        except Exception:
+            try:
+                parsed = json.loads(text)
+            except Exception:
+                try:
+                    parsed = ast.literal_eval(text)
+                except Exception:
+                    parsed = None
+                    errors += len(positions)
+                    if first_error is None:
+                        first_error = (series.index[positions[0]], text[:200])
+        if isinstance(parsed, list):
+            result = parsed
+        elif isinstance(parsed, dict):
+            result = [parsed]
+        else:
+            result = []
+        for position in positions:
+            decoded[position] = result
+        if parsed_cache is not None:
+            parsed_cache[raw_text] = result
+    stats = _nested_parse_stats.setdefault(col, {'values': 0, 'errors': 0, 'cache_hits': 0, 'encoding': encoding, 'seconds': 0.0})
+    stats['values'] += len(decoded)
+    stats['errors'] += errors
+    stats['cache_hits'] += cache_hits
+    stats['encoding'] = encoding
+    stats['seconds'] += time.perf_counter() - start
+    if errors:
+        log_message(f'[WARNING] Could not parse {errors} of {len(decoded)} value(s) in "{col}". First failure at row index {first_error[0]}: {first_error[1]}')
+    return decoded
+
+
+def get_nested_parse_report(reset=False):
+    report = pd.DataFrame(
+        [{'column': col, **stats} for col, stats in _nested_parse_stats.items()],
+        columns=['column', 'encoding', 'values', 'errors', 'cache_hits', 'seconds']
+    )
+    if reset:
+        _nested_parse_stats.clear()
+    return report
+
+
 def flatten_line_items(
     df,
     col,
-    header_to_line_columns={"source_h_col": "output_h_col"}
+    header_to_line_columns={"source_h_col": "output_h_col"},
+    parsed_cache=None
 ):
-    def safe_parse(value, row_index):
-        try:
-            if isinstance(value, list):
-                return value
-            if value is None:
-                return []
-            if isinstance(value, float) and pd.isna(value):
-                return []
-            if pd.isna(value) and not isinstance(value, (list, dict)):
-                return []
-            if isinstance(value, dict):
-                return [value]
-            if isinstance(value, str):
-                value=value.strip()
-                if value=="":
-                    return []
-                try:
-                    parsed=json.loads(value)
-                    if isinstance(parsed, list):
-                        return parsed
-                    if isinstance(parsed, dict):
-                        return [parsed]
-                    return []
-                except Exception:
-                    pass
-                try:
-                    parsed=ast.literal_eval(value)
-                    if isinstance(parsed, list):
-                        return parsed
-                    if isinstance(parsed, dict):
-                        return [parsed]
-                    return []
-                except Exception:
-                    pass
-            return []
-        except Exception as exc:
-            log_message(
-                f"[WARNING] Could not parse {col}. "
-                f"Row index: {row_index}. "
-                f"Error: {exc}. "
-                f"Value preview: {str(value)[:500]}"
-            )
-            return []
     if col not in df.columns:
         log_message(f'[INFO] Column "{col}" not found. Skipping flatten.')
         return pd.DataFrame()
@@ -306,10 +497,7 @@ def flatten_line_items(
             log_message(f'[WARNING] Header column "{source_h_col}" not found.')
             return pd.DataFrame()
     df=df.copy()
-    df[col]=[
-        safe_parse(value, row_index)
-        for row_index, value in df[col].items()
-    ]
+    df[col]=decode_nested_column(df[col], col, parsed_cache)
     df=df[source_header_cols + [col]].explode(col, ignore_index=True)
     df=df[df[col].notna()].reset_index(drop=True)
     if df.empty:
@@ -323,6 +511,26 @@ def flatten_line_items(
     return line_df
 
 
+def _pivot_joined_values(df, index_col, columns_col, values_col, sep=", "):
+    # Same cells as pivot_table(aggfunc=lambda x: sep.join(x.dropna().astype(str).unique())), without a Python call per cell
+    cells=df[[index_col, columns_col]].drop_duplicates()
+    values=df.loc[df[values_col].notna(), [index_col, columns_col, values_col]]
+    values=values.assign(**{values_col: values[values_col].astype(str)}).drop_duplicates()
+    repeated=values.duplicated(subset=[index_col, columns_col], keep=False)
+    joined=values.loc[~repeated]
+    if repeated.any():
+        joined=pd.concat([
+            joined,
+            values.loc[repeated]
+            .groupby([index_col, columns_col], sort=False)[values_col]
+            .agg(sep.join)
+            .reset_index()
+        ], ignore_index=True)
+    cells=cells.merge(joined, on=[index_col, columns_col], how="left")
+    cells[values_col]=cells[values_col].fillna("")
+    return cells.set_index([index_col, columns_col])[values_col].unstack(columns_col)
+
+
 def merge_flattened_pivot(
     df,
     nested_col,
@@ -330,7 +538,8 @@ def merge_flattened_pivot(
     value_col,
     source_h_col="Id",
     output_h_col="Id",
-    suffix=""
+    suffix="",
+    parsed_cache=None
 ):
     df=df.copy()
     if source_h_col not in df.columns:
@@ -339,36 +548,34 @@ def merge_flattened_pivot(
     if nested_col not in df.columns:
         log_message(f'[INFO] Column "{nested_col}" not found. Skipping.')
         return df
-    original_id_dtype=df[source_h_col].dtype
-    df[source_h_col]=pd.to_numeric(
+    # Ids are matched numerically through a temporary key, so the header column itself keeps its dtype
+    pivot_key="__pivot_key__"
+    df[pivot_key]=pd.to_numeric(
         df[source_h_col],
         errors="coerce"
     )
     flattened=flatten_line_items(
         df=df,
         col=nested_col,
-        header_to_line_columns={source_h_col: output_h_col}
+        header_to_line_columns={pivot_key: pivot_key},
+        parsed_cache=parsed_cache
     )
     if flattened.empty:
         log_message(f'[INFO] No data found in "{nested_col}". Skipping.')
-        return df
+        return df.drop(columns=[pivot_key])
     missing_cols=[
-        c for c in [output_h_col, name_col, value_col]
+        c for c in [name_col, value_col]
         if c not in flattened.columns
     ]
     if missing_cols:
         log_message(
             f'[WARNING] Missing columns {missing_cols} in "{nested_col}". Skipping.'
         )
-        return df
-    flattened[output_h_col]=pd.to_numeric(
-        flattened[output_h_col],
-        errors="coerce"
-    )
-    flattened=flattened.dropna(subset=[output_h_col, name_col])
+        return df.drop(columns=[pivot_key])
+    flattened=flattened.dropna(subset=[pivot_key, name_col])
     if flattened.empty:
         log_message(f'[INFO] No valid rows found in "{nested_col}" after cleaning.')
-        return df
+        return df.drop(columns=[pivot_key])
     flattened["pivot_col"]=(
         flattened[name_col]
         .astype(str)
@@ -376,33 +583,17 @@ def merge_flattened_pivot(
         .str.replace(" ", "", regex=False)
         + suffix
     )
-    flattened=(
-        flattened
-        .pivot_table(
-            index=output_h_col,
-            columns="pivot_col",
-            values=value_col,
-            aggfunc=lambda x: ", ".join(x.dropna().astype(str).unique())
-        )
-        .reset_index()
-    )
+    flattened=_pivot_joined_values(flattened, pivot_key, "pivot_col", value_col).reset_index()
     flattened.columns.name=None
     df=df.merge(
         flattened,
-        left_on=source_h_col,
-        right_on=output_h_col,
+        on=pivot_key,
         how="left"
     )
-    if output_h_col != source_h_col and output_h_col in df.columns:
-        df=df.drop(columns=[output_h_col])
-    try:
-        df[source_h_col]=df[source_h_col].astype(original_id_dtype)
-    except Exception:
-        pass
-    return df
+    return df.drop(columns=[pivot_key])
 
 
-def add_flattened_qbo_fields(df):
+def add_flattened_qbo_fields(df, parsed_cache=None):
     flattened_fields=[
         {
             "nested_col": "LinkedTxn",
@@ -429,7 +620,8 @@ def add_flattened_qbo_fields(df):
             value_col=field["value_col"],
             source_h_col=field["source_h_col"],
             output_h_col=field["output_h_col"],
-            suffix=field["suffix"]
+            suffix=field["suffix"],
+            parsed_cache=parsed_cache
         )
     return df
 
@@ -438,15 +630,21 @@ def process_qbo_table(
     s3_client,
     s3_bucket_name,
     config,
+    prefetcher=None,
 ):
-    df = read_file_from_s3(
-        s3_client=s3_client,
-        bucket_name=s3_bucket_name,
-        object_key=config["file"]
-    )
+    if prefetcher is not None:
+        df = prefetcher.get(config["file"], s3_bucket_name)
+    else:
+        df = read_file_from_s3(
+            s3_client=s3_client,
+            bucket_name=s3_bucket_name,
+            object_key=config["file"]
+        )
     table_type = config.get("table_type", "Transaction")
+    # Shared by every flatten below so each nested cell of this table is decoded once
+    parsed_cache = {}
     if config.get("flatten_transaction_fields", False):
-        df = add_flattened_qbo_fields(df)
+        df = add_flattened_qbo_fields(df, parsed_cache)
     df.rename(columns=config.get("transaction_rename", {}), inplace=True)
     df[f"{table_type}Type"] = config["transaction_type"]
     status = config["status"]
@@ -465,7 +663,8 @@ def process_qbo_table(
             temp_lines = flatten_line_items(
                 df=df,
                 col=line_config["nested_col"],
-                header_to_line_columns=header_to_line_columns
+                header_to_line_columns=header_to_line_columns,
+                parsed_cache=parsed_cache
             )
             if temp_lines.empty:
                 continue
@@ -478,7 +677,8 @@ def process_qbo_table(
                 group_lines = flatten_line_items(
                     df=temp_lines,
                     col=group_lines_config.get("nested_col", "GroupLineDetail.Line"),
-                    header_to_line_columns=header_to_line_columns
+                    header_to_line_columns=header_to_line_columns,
+                    parsed_cache=parsed_cache
                 )
 
                 drop_detail_types = group_lines_config.get(
@@ -497,7 +697,7 @@ def process_qbo_table(
                         ignore_index=True
                     )
             if config.get("flatten_line_fields", False):
-                temp_lines = add_flattened_qbo_fields(temp_lines)
+                temp_lines = add_flattened_qbo_fields(temp_lines, parsed_cache)
             temp_lines.rename(columns=line_config.get("rename", {}), inplace=True)
             if "multiply_total" in line_config and "Total" in temp_lines.columns:
                 temp_lines["Total"] = temp_lines["Total"] * line_config["multiply_total"]
@@ -514,6 +714,20 @@ def process_qbo_table(
     return df, lines
 
 
+# Bronze objects read by process_qbo_transactions, in the order its transforms consume them
+QBO_TRANSACTION_FILES = [
+    "JournalEntry.csv",
+    "Bill.csv",
+    "Purchase.csv",
+    "Payment.csv",
+    "Deposit.csv",
+    "Invoice.csv",
+    "VendorCredit.csv",
+    "BillPayment.csv",
+    "CreditMemo.csv",
+]
+
+
 def process_qbo_transactions(
     account,
     companyName,
@@ -522,12 +736,30 @@ def process_qbo_transactions(
     start_date,
     end_date,
     s3_client,
-    s3_bucket_name
+    s3_bucket_name,
+    prefetch_workers=4,
+    prefetch_max_ready=6
+):
+    with _S3Prefetcher(s3_client, s3_bucket_name, QBO_TRANSACTION_FILES, prefetch_workers, prefetch_max_ready) as prefetcher:
+        return _process_qbo_transactions(account, companyName, item, customer, start_date, end_date, s3_client, s3_bucket_name, prefetcher)
+
+
+def _process_qbo_transactions(
+    account,
+    companyName,
+    item,
+    customer,
+    start_date,
+    end_date,
+    s3_client,
+    s3_bucket_name,
+    prefetcher=None
 ):
 
     generalJournal, generalJournalLines = process_qbo_table(
     s3_client=s3_client,
     s3_bucket_name=s3_bucket_name,
+    prefetcher=prefetcher,
     config={
         "name": "generalJournal",
         "file": "JournalEntry.csv",
@@ -560,6 +792,7 @@ def process_qbo_transactions(
     bills, billExpenseLines = process_qbo_table(
     s3_client=s3_client,
     s3_bucket_name=s3_bucket_name,
+    prefetcher=prefetcher,
     config={
         "name": "bills",
         "file": "Bill.csv",
@@ -607,14 +840,12 @@ def process_qbo_transactions(
             },
         },
     })
-    bills['BillAddress'] = bills[['VendorAddr.Line2', 'VendorAddr.Line3', 'VendorAddr.Line4', 'VendorAddr.Line5']].fillna('').apply(
-        lambda row: ' :: '.join([str(val).upper().strip() for val in row if str(val).strip() != '']), 
-        axis=1
-    )
+    bills['BillAddress'] = join_non_empty_columns(bills, ['VendorAddr.Line2', 'VendorAddr.Line3', 'VendorAddr.Line4', 'VendorAddr.Line5'], ' :: ', upper=True, strip=True)
 
     checks, checkExpenseLine = process_qbo_table(
     s3_client=s3_client,
     s3_bucket_name=s3_bucket_name,
+    prefetcher=prefetcher,
     config={
         "name": "checks",
         "file": "Purchase.csv",
@@ -651,14 +882,12 @@ def process_qbo_transactions(
             },
         },
     })
-    checks['BillAddress'] = checks[['RemitToAddr.Line2', 'RemitToAddr.Line3', 'RemitToAddr.Line4', 'RemitToAddr.Line5']].fillna('').apply(
-        lambda row: ' :: '.join([str(val).upper().strip() for val in row if str(val).strip() != '']), 
-        axis=1
-    )
+    checks['BillAddress'] = join_non_empty_columns(checks, ['RemitToAddr.Line2', 'RemitToAddr.Line3', 'RemitToAddr.Line4', 'RemitToAddr.Line5'], ' :: ', upper=True, strip=True)
 
     receivePayment, receivePaymentLines = process_qbo_table(
     s3_client=s3_client,
     s3_bucket_name=s3_bucket_name,
+    prefetcher=prefetcher,
     config={
         "name": "receivePayment",
         "file": "Payment.csv",
@@ -697,6 +926,7 @@ def process_qbo_transactions(
     deposit, depositLines = process_qbo_table(
     s3_client=s3_client,
     s3_bucket_name=s3_bucket_name,
+    prefetcher=prefetcher,
     config={
         "name": "deposit",
         "file": "Deposit.csv",
@@ -729,6 +959,7 @@ def process_qbo_transactions(
     invoice, invoiceLines = process_qbo_table(
     s3_client=s3_client,
     s3_bucket_name=s3_bucket_name,
+    prefetcher=prefetcher,
     config={
         "name": "invoice",
         "file": "Invoice.csv",
@@ -786,18 +1017,13 @@ def process_qbo_transactions(
             },
         },
     })
-    invoice['BillAddress'] = invoice[['BillAddr.Line2', 'BillAddr.Line3', 'BillAddr.Line4', 'BillAddr.Line5']].fillna('').apply(
-        lambda row: ' :: '.join([str(val).upper().strip() for val in row if str(val).strip() != '']), 
-        axis=1
-    )
-    invoice['ShipAddress'] = invoice[['ShipAddr.Line2', 'ShipAddr.Line3', 'ShipAddr.Line4', 'ShipAddr.Line5']].fillna('').apply(
-        lambda row: ' :: '.join([str(val).upper().strip() for val in row if str(val).strip() != '']), 
-        axis=1
-    )
+    invoice['BillAddress'] = join_non_empty_columns(invoice, ['BillAddr.Line2', 'BillAddr.Line3', 'BillAddr.Line4', 'BillAddr.Line5'], ' :: ', upper=True, strip=True)
+    invoice['ShipAddress'] = join_non_empty_columns(invoice, ['ShipAddr.Line2', 'ShipAddr.Line3', 'ShipAddr.Line4', 'ShipAddr.Line5'], ' :: ', upper=True, strip=True)
 
     vendorCredit, vendorCreditExpenseLines = process_qbo_table(
     s3_client=s3_client,
     s3_bucket_name=s3_bucket_name,
+    prefetcher=prefetcher,
     config={
         "name": "vendorCredit",
         "file": "VendorCredit.csv",
@@ -834,14 +1060,12 @@ def process_qbo_transactions(
             "multiply_total": -1,
         },
     })
-    vendorCredit['BillAddress'] = vendorCredit[['VendorAddr.Line2', 'VendorAddr.Line3', 'VendorAddr.Line4', 'VendorAddr.Line5']].fillna('').apply(
-        lambda row: ' :: '.join([str(val).upper().strip() for val in row if str(val).strip() != '']), 
-        axis=1
-    )
+    vendorCredit['BillAddress'] = join_non_empty_columns(vendorCredit, ['VendorAddr.Line2', 'VendorAddr.Line3', 'VendorAddr.Line4', 'VendorAddr.Line5'], ' :: ', upper=True, strip=True)
 
     billPaymentCheck, billPaymentCheckLines = process_qbo_table(
     s3_client=s3_client,
     s3_bucket_name=s3_bucket_name,
+    prefetcher=prefetcher,
     config={
         "name": "billPaymentCheck",
         "file": "BillPayment.csv",
@@ -873,6 +1097,7 @@ def process_qbo_transactions(
     creditMemo, creditMemoLines = process_qbo_table(
     s3_client=s3_client,
     s3_bucket_name=s3_bucket_name,
+    prefetcher=prefetcher,
     config={
         "name": "creditMemo",
         "file": "CreditMemo.csv",
@@ -916,14 +1141,8 @@ def process_qbo_transactions(
             "multiply_total": -1,
         },
     })
-    creditMemo['BillAddress'] = creditMemo[['BillAddr.Line2', 'BillAddr.Line3', 'BillAddr.Line4', 'BillAddr.Line5']].fillna('').apply(
-        lambda row: ' :: '.join([str(val).upper().strip() for val in row if str(val).strip() != '']), 
-        axis=1
-    )
-    creditMemo['ShipAddress'] = creditMemo[['ShipAddr.Line2', 'ShipAddr.Line3', 'ShipAddr.Line4', 'ShipAddr.Line5']].fillna('').apply(
-        lambda row: ' :: '.join([str(val).upper().strip() for val in row if str(val).strip() != '']), 
-        axis=1
-    )
+    creditMemo['BillAddress'] = join_non_empty_columns(creditMemo, ['BillAddr.Line2', 'BillAddr.Line3', 'BillAddr.Line4', 'BillAddr.Line5'], ' :: ', upper=True, strip=True)
+    creditMemo['ShipAddress'] = join_non_empty_columns(creditMemo, ['ShipAddr.Line2', 'ShipAddr.Line3', 'ShipAddr.Line4', 'ShipAddr.Line5'], ' :: ', upper=True, strip=True)
 
     txns=pd.concat([
         generalJournal,
@@ -1054,14 +1273,8 @@ def process_qbo_orders(
             }
         ],
     })
-    orders['BillAddress'] = orders[['VendorAddr.Line2', 'VendorAddr.Line3', 'VendorAddr.Line4', 'VendorAddr.Line5']].fillna('').apply(
-        lambda row: ' :: '.join([str(val).upper().strip() for val in row if str(val).strip() != '']), 
-        axis=1
-    )
-    orders['ShipAddress'] = orders[['ShipAddr.Line2', 'ShipAddr.Line3']].fillna('').apply(
-        lambda row: ' :: '.join([str(val).upper().strip() for val in row if str(val).strip() != '']), 
-        axis=1
-    )
+    orders['BillAddress'] = join_non_empty_columns(orders, ['VendorAddr.Line2', 'VendorAddr.Line3', 'VendorAddr.Line4', 'VendorAddr.Line5'], ' :: ', upper=True, strip=True)
+    orders['ShipAddress'] = join_non_empty_columns(orders, ['ShipAddr.Line2', 'ShipAddr.Line3'], ' :: ', upper=True, strip=True)
     ordersLines['ItemDescription'] = ordersLines['ItemDescription'].fillna('').astype('str').str.replace(r'\\n', ' ', regex=True)
     ordersLines = ordersLines[~ordersLines['OrderId'].isna()].copy()
     ordersLines['OrderId'] = ordersLines['OrderId'].fillna('').astype('str')
@@ -1190,6 +1403,96 @@ def normalize_nested_json(data):
     return df
 
 
+HTTP_SESSION_CONFIG = {
+    "pool_connections": 16,
+    "pool_maxsize": 16,
+    "host_pool_maxsize": {},
+    "total_retries": 3,
+    "backoff_factor": 0.5,
+    "status_forcelist": (429, 500, 502, 503, 504),
+    "timeout": (10, 600),
+}
+_http_session = None
+_http_session_lock = threading.Lock()
+_http_stats = {}
+_http_stats_lock = threading.Lock()
+
+
+class _PooledSession(requests.Session):
+    # Applies the default timeout and records per-host request counts and latency
+    def __init__(self, timeout):
+        super().__init__()
+        self.default_timeout = timeout
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.default_timeout)
+        host = urlparse(url).netloc
+        started = time.perf_counter()
+        failed = True
+        try:
+            response = super().request(method, url, **kwargs)
+            failed = response.status_code >= 400
+            return response
+        finally:
+            elapsed = time.perf_counter() - started
+            with _http_stats_lock:
+                stats = _http_stats.setdefault(host, {'requests': 0, 'errors': 0, 'seconds': 0.0, 'max_seconds': 0.0})
+                stats['requests'] += 1
+                stats['errors'] += int(failed)
+                stats['seconds'] += elapsed
+                stats['max_seconds'] = max(stats['max_seconds'], elapsed)
+
+
+def _build_http_adapter(pool_maxsize):
+    retries = Retry(
+        total=HTTP_SESSION_CONFIG["total_retries"],
+        backoff_factor=HTTP_SESSION_CONFIG["backoff_factor"],
+        status_forcelist=HTTP_SESSION_CONFIG["status_forcelist"],
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    return HTTPAdapter(pool_connections=HTTP_SESSION_CONFIG["pool_connections"], pool_maxsize=pool_maxsize, max_retries=retries)
+
+
+def get_http_session():
+    # One keep-alive session shared by every REST helper; retries only cover idempotent methods, never token POSTs
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            session = _PooledSession(HTTP_SESSION_CONFIG["timeout"])
+            session.headers.update({'Accept-Encoding': 'gzip, deflate'})
+            adapter = _build_http_adapter(HTTP_SESSION_CONFIG["pool_maxsize"])
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            for url_prefix, pool_maxsize in HTTP_SESSION_CONFIG["host_pool_maxsize"].items():
+                session.mount(url_prefix, _build_http_adapter(pool_maxsize))
+            _http_session = session
+        return _http_session
+
+
+def configure_http_session(**config):
+    global _http_session
+    unknown = set(config) - set(HTTP_SESSION_CONFIG)
+    if unknown:
+        raise ValueError(f"Unknown HTTP session settings: {sorted(unknown)}")
+    with _http_session_lock:
+        HTTP_SESSION_CONFIG.update(config)
+        if _http_session is not None:
+            _http_session.close()
+            _http_session = None
+    return get_http_session()
+
+
+def get_http_stats(reset=False):
+    with _http_stats_lock:
+        rows = [{'host': host, **stats} for host, stats in _http_stats.items()]
+        if reset:
+            _http_stats.clear()
+    stats_df = pd.DataFrame(rows, columns=['host', 'requests', 'errors', 'seconds', 'max_seconds'])
+    stats_df['avg_ms'] = (stats_df['seconds'] / stats_df['requests'].where(stats_df['requests'] > 0) * 1000).round(1)
+    return stats_df.sort_values('seconds', ascending=False).reset_index(drop=True)
+
+
 def create_token(username, password, customer_alias, shared_key, create_token_url):
     payload = {
         "SharedKey": shared_key,
@@ -1200,7 +1503,7 @@ def create_token(username, password, customer_alias, shared_key, create_token_ur
     headers = {
         "Content-Type": "application/json"
     }
-    response = requests.post(
+    response = get_http_session().post(
         create_token_url,
         json=payload,
         headers=headers
@@ -1751,10 +2054,7 @@ def process_gp_transactions(
     txnsLines.rename(columns = {'SLSINDX':'ACTINDX'}, inplace = True)
     txnsLines['XTNDPRCE'] = txnsLines['XTNDPRCE'].astype('float')
     txnsLines = txnsLines.merge(txns, on = ['SOPNUMBE'], suffixes = ('', '_inv'))
-    txnsLines['ShipAddress'] = txnsLines[['ADDRESS1', 'ADDRESS2', 'ADDRESS3']].fillna('').apply(
-        lambda row: ' :: '.join([str(val).upper().strip() for val in row if str(val).strip() != '']),
-        axis=1
-    )
+    txnsLines['ShipAddress'] = join_non_empty_columns(txnsLines, ['ADDRESS1', 'ADDRESS2', 'ADDRESS3'], ' :: ', upper=True, strip=True)
     txnsLines.rename(columns = {
         'ORIGNUMB':'OrderId',
         'GLPOSTDT':'TransactionDate',
@@ -1860,10 +2160,7 @@ def process_gp_orders(
 
     orders = clean_df(s3_client = s3_client, s3_bucket_name = s3_bucket_name, df = orders, df_name = 'orders', id_column = [], additional_date_columns = [], zip_code_columns = [], keep_invalid_as_null=True, numeric_id=False, just_useful_columns=False )
     orders = clean_df(s3_client = s3_client, s3_bucket_name = s3_bucket_name, df = orders, df_name = 'orders', id_column = [txnsType], additional_date_columns = [], zip_code_columns = [], keep_invalid_as_null=True, numeric_id=False, just_useful_columns=False )
-    orders['ShipAddress'] = orders[['ADDRESS1', 'ADDRESS2', 'ADDRESS3']].fillna('').apply(
-        lambda row: ' :: '.join([str(val).upper().strip() for val in row if str(val).strip() != '']),
-        axis=1
-    )
+    orders['ShipAddress'] = join_non_empty_columns(orders, ['ADDRESS1', 'ADDRESS2', 'ADDRESS3'], ' :: ', upper=True, strip=True)
     orders.rename(columns = {
         txnsType:f'{txnsType2}No', 
         'CREATDDT':f'{txnsType2}Date',
@@ -2001,6 +2298,40 @@ def get_expected_columns(
     return list(dict.fromkeys(cols))
 
 
+# Bronze objects read by process_qb_transactions, in the order its transforms consume them
+QB_TRANSACTION_FILES = [
+    "Transaction.csv",
+    "JournalEntry.csv",
+    "JournalEntryLine.csv",
+    "Bill.csv",
+    "BillExpenseLine.csv",
+    "Check.csv",
+    "CheckExpenseLine.csv",
+    "ReceivePayment.csv",
+    "ReceivePaymentLine.csv",
+    "Deposit.csv",
+    "DepositLine.csv",
+    "Invoice.csv",
+    "InvoiceLine.csv",
+    "CreditCardCredit.csv",
+    "CreditCardCreditExpenseLine.csv",
+    "BillItemLine.csv",
+    "CheckItemLine.csv",
+    "VendorCredit.csv",
+    "VendorCreditItemLine.csv",
+    "VendorCreditExpenseLine.csv",
+    "SalesReceipt.csv",
+    "SalesReceiptLine.csv",
+    "BillPaymentCheck.csv",
+    "BillPaymentCheckLine.csv",
+    "CreditCardCharge.csv",
+    "CreditCardChargeExpenseLine.csv",
+    "CreditMemo.csv",
+    "CreditMemoLine.csv",
+    "SalesRep.csv",
+]
+
+
 def process_qb_transactions(
     account,
     companyName,
@@ -2009,7 +2340,24 @@ def process_qb_transactions(
     start_date,
     end_date,
     s3_client,
-    s3_bucket_name_bronze
+    s3_bucket_name_bronze,
+    prefetch_workers=4,
+    prefetch_max_ready=6
+):
+    with _S3Prefetcher(s3_client, s3_bucket_name_bronze, QB_TRANSACTION_FILES, prefetch_workers, prefetch_max_ready) as prefetcher:
+        return _process_qb_transactions(account, companyName, item, customer, start_date, end_date, s3_client, s3_bucket_name_bronze, prefetcher)
+
+
+def _process_qb_transactions(
+    account,
+    companyName,
+    item,
+    customer,
+    start_date,
+    end_date,
+    s3_client,
+    s3_bucket_name_bronze,
+    prefetcher=None
 ):
     customersORvendors = customer.copy()
 
@@ -2022,7 +2370,7 @@ def process_qb_transactions(
         }
     }
     expected_columns = get_expected_columns(config, extra=['FQTxnLinkKey', 'TimeModified'])
-    transactions = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns)
+    transactions = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns, prefetcher=prefetcher)
     transactions = transactions.sort_values(['FQTxnLinkKey', 'TimeModified']).drop_duplicates(subset=['FQTxnLinkKey'], keep='last').copy()
     transactions.rename(columns=config['rename'], inplace=True)
 
@@ -2031,7 +2379,7 @@ def process_qb_transactions(
         "file": "JournalEntry.csv"
     }
     expected_columns = get_expected_columns(config, extra=['TxnID'])
-    generalJournal = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns)
+    generalJournal = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns, prefetcher=prefetcher)
 
     config = {
         "file": "JournalEntryLine.csv",
@@ -2049,7 +2397,7 @@ def process_qb_transactions(
         }
     }
     expected_columns = get_expected_columns(config, extra=['TxnID'])
-    generalJournalLines = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns)
+    generalJournalLines = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns, prefetcher=prefetcher)
     generalJournalLines = generalJournal.merge(generalJournalLines, on='TxnID', suffixes=('_h', ''))
     generalJournalLines = generalJournalLines.reset_index(drop=True).reset_index()
     generalJournalLines['TransactionId'] = 'GENERAL JOURNAL' + ' :: ' + generalJournalLines['index'].astype(str)
@@ -2078,11 +2426,8 @@ def process_qb_transactions(
         }
     }
     expected_columns = get_expected_columns(config, extra=['VendorAddressAddr2', 'VendorAddressAddr3', 'VendorAddressAddr4'])
-    bills = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns)
-    bills['BillAddress'] = bills[['VendorAddressAddr2', 'VendorAddressAddr3', 'VendorAddressAddr4']].fillna('').apply(
-        lambda row: ' :: '.join([str(val).upper().strip() for val in row if str(val).strip() != '']), 
-        axis=1
-    )
+    bills = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns, prefetcher=prefetcher)
+    bills['BillAddress'] = join_non_empty_columns(bills, ['VendorAddressAddr2', 'VendorAddressAddr3', 'VendorAddressAddr4'], ' :: ', upper=True, strip=True)
     bills.rename(columns=config['rename'], inplace=True)
     bills['TransactionType'] = config['transaction_type']
 
@@ -2103,7 +2448,7 @@ def process_qb_transactions(
         }
     }
     expected_columns = get_expected_columns(config)
-    billExpenseLines = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns)
+    billExpenseLines = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns, prefetcher=prefetcher)
     billExpenseLines.rename(columns=config['rename'], inplace=True)
     billExpenseLines['Total'] = billExpenseLines['Total'] * config['multiply_total']
     billExpenseLines["OpenTotal"] = np.where(
@@ -2129,11 +2474,8 @@ def process_qb_transactions(
         }
     }
     expected_columns = get_expected_columns(config, extra=['AddressAddr2', 'AddressAddr3', 'AddressAddr4', 'AddressAddr5'])
-    checks = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns)
-    checks['BillAddress'] = checks[['AddressAddr2', 'AddressAddr3', 'AddressAddr4', 'AddressAddr5']].fillna('').apply(
-        lambda row: ' :: '.join([str(val).upper().strip() for val in row if str(val).strip() != '']), 
-        axis=1
-    )
+    checks = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns, prefetcher=prefetcher)
+    checks['BillAddress'] = join_non_empty_columns(checks, ['AddressAddr2', 'AddressAddr3', 'AddressAddr4', 'AddressAddr5'], ' :: ', upper=True, strip=True)
     checks.rename(columns=config['rename'], inplace=True)
     checks['TransactionType'] = config['transaction_type']
 
@@ -2152,7 +2494,7 @@ def process_qb_transactions(
         }
     }
     expected_columns = get_expected_columns(config)
-    checkExpenseLine = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns)
+    checkExpenseLine = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns, prefetcher=prefetcher)
     checkExpenseLine.drop(columns=config['drop'], inplace=True)
     checkExpenseLine.rename(columns=config['rename'], inplace=True)
     checkExpenseLine['Total'] = checkExpenseLine['Total'] * config['multiply_total']
@@ -2177,7 +2519,7 @@ def process_qb_transactions(
         }
     }
     expected_columns = get_expected_columns(config)
-    receivePayment = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns)
+    receivePayment = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns, prefetcher=prefetcher)
     receivePayment.rename(columns=config['rename'], inplace=True)
     receivePayment['TransactionType'] = config['transaction_type']
 
@@ -2194,7 +2536,7 @@ def process_qb_transactions(
         }
     }
     expected_columns = get_expected_columns(config, extra=['DepositToAccountRefFullName', 'TotalAmount'])
-    receivePaymentLines = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns)
+    receivePaymentLines = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns, prefetcher=prefetcher)
     receivePaymentLines.loc[
         receivePaymentLines['AppliedToTxnDiscountAccountRefFullName'].isna(),
         'AppliedToTxnDiscountAccountRefFullName'
@@ -2212,7 +2554,7 @@ def process_qb_transactions(
         "file": "Deposit.csv"
     }
     expected_columns = get_expected_columns(config, extra=['TxnID'])
-    deposit = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns)
+    deposit = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns, prefetcher=prefetcher)
 
     config = {
         "file": "DepositLine.csv",
@@ -2230,7 +2572,7 @@ def process_qb_transactions(
         }
     }
     expected_columns = get_expected_columns(config, extra=['TxnID'])
-    depositLines = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns)
+    depositLines = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns, prefetcher=prefetcher)
     depositLines = deposit.merge(depositLines, on='TxnID', suffixes=('_h', ''))
     depositLines = depositLines.reset_index(drop=True).reset_index()
     depositLines['TransactionId'] = 'DEPOSIT' + ' :: ' + depositLines['index'].astype(str)
@@ -2264,15 +2606,9 @@ def process_qb_transactions(
         }
     }
     expected_columns = get_expected_columns(config, extra=['BillAddressAddr2', 'BillAddressAddr3', 'BillAddressAddr4', 'BillAddressAddr5', 'ShipAddressAddr2', 'ShipAddressAddr3', 'ShipAddressAddr4', 'ShipAddressAddr5'])
-    invoice = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns)
-    invoice['BillAddress'] = invoice[['BillAddressAddr2', 'BillAddressAddr3', 'BillAddressAddr4', 'BillAddressAddr5']].fillna('').apply(
-        lambda row: ' :: '.join([str(val).upper().strip() for val in row if str(val).strip() != '']), 
-        axis=1
-    )
-    invoice['ShipAddress'] = invoice[['ShipAddressAddr2', 'ShipAddressAddr3', 'ShipAddressAddr4', 'ShipAddressAddr5']].fillna('').apply(
-        lambda row: ' :: '.join([str(val).upper().strip() for val in row if str(val).strip() != '']), 
-        axis=1
-    )
+    invoice = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns, prefetcher=prefetcher)
+    invoice['BillAddress'] = join_non_empty_columns(invoice, ['BillAddressAddr2', 'BillAddressAddr3', 'BillAddressAddr4', 'BillAddressAddr5'], ' :: ', upper=True, strip=True)
+    invoice['ShipAddress'] = join_non_empty_columns(invoice, ['ShipAddressAddr2', 'ShipAddressAddr3', 'ShipAddressAddr4', 'ShipAddressAddr5'], ' :: ', upper=True, strip=True)
     invoice.rename(columns=config['rename'], inplace=True)
     invoice['TransactionType'] = config['transaction_type']
 
@@ -2291,7 +2627,7 @@ def process_qb_transactions(
         }
     }
     expected_columns = get_expected_columns(config, extra=['FQTxnLinkKey'])
-    invoiceLines = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns)
+    invoiceLines = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns, prefetcher=prefetcher)
     invoiceLines = invoiceLines.merge(
         transactions[['FQTxnLinkKey', 'AccountRefListID', 'Account']],
         on=['FQTxnLinkKey'],
@@ -2317,7 +2653,7 @@ def process_qb_transactions(
         }
     }
     expected_columns = get_expected_columns(config)
-    creditCardCredit = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns)
+    creditCardCredit = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns, prefetcher=prefetcher)
     creditCardCredit.rename(columns=config['rename'], inplace=True)
     creditCardCredit['TransactionType'] = config['transaction_type']
 
@@ -2338,7 +2674,7 @@ def process_qb_transactions(
         }
     }
     expected_columns = get_expected_columns(config)
-    creditCardCreditLines = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns)
+    creditCardCreditLines = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns, prefetcher=prefetcher)
     creditCardCreditLines.drop(columns=config['drop'], inplace=True)
     creditCardCreditLines.rename(columns=config['rename'], inplace=True)
     creditCardCreditLines['Total'] = creditCardCreditLines['Total'] * config['multiply_total']
@@ -2359,7 +2695,7 @@ def process_qb_transactions(
         }
     }
     expected_columns = get_expected_columns(config, extra=['FQTxnLinkKey'])
-    billsLines = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns)
+    billsLines = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns, prefetcher=prefetcher)
     billsLines = billsLines.merge(
         transactions[['FQTxnLinkKey', 'AccountRefListID', 'Account']],
         on='FQTxnLinkKey',
@@ -2386,7 +2722,7 @@ def process_qb_transactions(
         }
     }
     expected_columns = get_expected_columns(config, extra=['FQTxnLinkKey'])
-    checksLines = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns)
+    checksLines = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns, prefetcher=prefetcher)
     checksLines.drop(columns=config['drop'], inplace=True)
     checksLines = checksLines.merge(
         transactions[['FQTxnLinkKey', 'AccountRefListID', 'Account']],
@@ -2415,7 +2751,7 @@ def process_qb_transactions(
         }
     }
     expected_columns = get_expected_columns(config)
-    vendorCredit = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns)
+    vendorCredit = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns, prefetcher=prefetcher)
     vendorCredit.rename(columns=config['rename'], inplace=True)
     vendorCredit['TransactionType'] = config['transaction_type']
 
@@ -2434,7 +2770,7 @@ def process_qb_transactions(
         }
     }
     expected_columns = get_expected_columns(config, extra=['FQTxnLinkKey'])
-    vendorCreditLines = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns)
+    vendorCreditLines = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns, prefetcher=prefetcher)
     vendorCreditLines = vendorCreditLines.merge(
         transactions[['FQTxnLinkKey', 'AccountRefListID', 'Account']],
         on='FQTxnLinkKey',
@@ -2459,7 +2795,7 @@ def process_qb_transactions(
         }
     }
     expected_columns = get_expected_columns(config)
-    vendorCreditExpenseLines = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns)
+    vendorCreditExpenseLines = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns, prefetcher=prefetcher)
     vendorCreditExpenseLines.rename(columns=config['rename'], inplace=True)
     vendorCreditExpenseLines['Total'] = vendorCreditExpenseLines['Total'] * config['multiply_total']
 
@@ -2481,11 +2817,8 @@ def process_qb_transactions(
         }
     }
     expected_columns = get_expected_columns(config, extra=['BillAddressAddr2', 'BillAddressAddr3', 'BillAddressAddr4', 'BillAddressAddr5'])
-    salesReceipts = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns)
-    salesReceipts['BillAddress'] = salesReceipts[['BillAddressAddr2', 'BillAddressAddr3', 'BillAddressAddr4', 'BillAddressAddr5']].fillna('').apply(
-        lambda row: ' :: '.join([str(val).upper().strip() for val in row if str(val).strip() != '']), 
-        axis=1
-    )
+    salesReceipts = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns, prefetcher=prefetcher)
+    salesReceipts['BillAddress'] = join_non_empty_columns(salesReceipts, ['BillAddressAddr2', 'BillAddressAddr3', 'BillAddressAddr4', 'BillAddressAddr5'], ' :: ', upper=True, strip=True)
     salesReceipts.rename(columns=config['rename'], inplace=True)
     salesReceipts['TransactionType'] = config['transaction_type']
 
@@ -2503,7 +2836,7 @@ def process_qb_transactions(
         }
     }
     expected_columns = get_expected_columns(config, extra=['FQTxnLinkKey'])
-    salesReceiptsLines = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns)
+    salesReceiptsLines = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns, prefetcher=prefetcher)
     salesReceiptsLines = salesReceiptsLines.merge(
         transactions[['FQTxnLinkKey', 'AccountRefListID', 'Account', 'Total']],
         on=['FQTxnLinkKey'],
@@ -2529,11 +2862,8 @@ def process_qb_transactions(
         }
     }
     expected_columns = get_expected_columns(config, extra=['AddressAddr2', 'AddressAddr3', 'AddressAddr4', 'AddressAddr5'])
-    billPaymentCheck = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns)
-    billPaymentCheck['BillAddress'] = billPaymentCheck[['AddressAddr2', 'AddressAddr3', 'AddressAddr4', 'AddressAddr5']].fillna('').apply(
-        lambda row: ' :: '.join([str(val).upper().strip() for val in row if str(val).strip() != '']), 
-        axis=1
-    )
+    billPaymentCheck = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns, prefetcher=prefetcher)
+    billPaymentCheck['BillAddress'] = join_non_empty_columns(billPaymentCheck, ['AddressAddr2', 'AddressAddr3', 'AddressAddr4', 'AddressAddr5'], ' :: ', upper=True, strip=True)
     billPaymentCheck.rename(columns=config['rename'], inplace=True)
     billPaymentCheck['TransactionType'] = config['transaction_type']
 
@@ -2550,7 +2880,7 @@ def process_qb_transactions(
         }
     }
     expected_columns = get_expected_columns(config)
-    billPaymentCheckLines = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns)
+    billPaymentCheckLines = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns, prefetcher=prefetcher)
     billPaymentCheckLines.rename(columns=config['rename'], inplace=True)
     billPaymentCheckLines['Total'] = billPaymentCheckLines['Total'] * config['multiply_total']
     billPaymentCheckLines['ItemDescription'] = billPaymentCheckLines['ItemId']
@@ -2575,7 +2905,7 @@ def process_qb_transactions(
         }
     }
     expected_columns = get_expected_columns(config)
-    creditCardCharge = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns)
+    creditCardCharge = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns, prefetcher=prefetcher)
     creditCardCharge.rename(columns=config['rename'], inplace=True)
     creditCardCharge['TransactionType'] = config['transaction_type']
 
@@ -2595,7 +2925,7 @@ def process_qb_transactions(
         }
     }
     expected_columns = get_expected_columns(config)
-    creditCardChargeLines = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns)
+    creditCardChargeLines = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns, prefetcher=prefetcher)
     creditCardChargeLines.drop(columns=config['drop'], inplace=True)
     creditCardChargeLines.rename(columns=config['rename'], inplace=True)
 
@@ -2622,15 +2952,9 @@ def process_qb_transactions(
         }
     }
     expected_columns = get_expected_columns(config, extra=['BillAddressAddr2', 'BillAddressAddr3', 'BillAddressAddr4', 'BillAddressAddr5', 'ShipAddressAddr2', 'ShipAddressAddr3', 'ShipAddressAddr4', 'ShipAddressAddr5'])
-    creditMemo = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns)
-    creditMemo['BillAddress'] = creditMemo[['BillAddressAddr2', 'BillAddressAddr3', 'BillAddressAddr4', 'BillAddressAddr5']].fillna('').apply(
-        lambda row: ' :: '.join([str(val).upper().strip() for val in row if str(val).strip() != '']), 
-        axis=1
-    )
-    creditMemo['ShipAddress'] = creditMemo[['ShipAddressAddr2', 'ShipAddressAddr3', 'ShipAddressAddr4', 'ShipAddressAddr5']].fillna('').apply(
-        lambda row: ' :: '.join([str(val).upper().strip() for val in row if str(val).strip() != '']), 
-        axis=1
-    )
+    creditMemo = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns, prefetcher=prefetcher)
+    creditMemo['BillAddress'] = join_non_empty_columns(creditMemo, ['BillAddressAddr2', 'BillAddressAddr3', 'BillAddressAddr4', 'BillAddressAddr5'], ' :: ', upper=True, strip=True)
+    creditMemo['ShipAddress'] = join_non_empty_columns(creditMemo, ['ShipAddressAddr2', 'ShipAddressAddr3', 'ShipAddressAddr4', 'ShipAddressAddr5'], ' :: ', upper=True, strip=True)
     creditMemo.rename(columns=config['rename'], inplace=True)
 
     config = {
@@ -2650,7 +2974,7 @@ def process_qb_transactions(
         "multiply_total": -1
     }
     expected_columns = get_expected_columns(config, extra=['FQTxnLinkKey'])
-    creditMemoLines = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns)
+    creditMemoLines = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns, prefetcher=prefetcher)
     creditMemoLines = creditMemoLines.merge(
         transactions[['FQTxnLinkKey', 'AccountRefListID', 'Account']],
         on=['FQTxnLinkKey'],
@@ -2665,7 +2989,7 @@ def process_qb_transactions(
         "file": "SalesRep.csv"
     }
     expected_columns = get_expected_columns(config, extra=['ListID', 'SalesRepEntityRefFullName'])
-    SalesRep = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns)
+    SalesRep = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns, prefetcher=prefetcher)
     SalesRep['SalesRepEntityRefFullName'] = SalesRep['SalesRepEntityRefFullName'].fillna('').astype('str').str.upper()
 
     txns = pd.concat([
@@ -2817,10 +3141,7 @@ def process_qb_orders(
     }
     expected_columns = get_expected_columns(config, extra=['ShipAddressAddr2', 'ShipAddressAddr3', 'ShipAddressAddr4', 'ShipAddressAddr5', 'IsManuallyClosed', object_key_3, object_key_4])
     orders = safe_read_file_from_s3(s3_client=s3_client, bucket_name=s3_bucket_name_bronze, object_key=config['file'], expected_columns=expected_columns)
-    orders['ShipAddress'] = orders[['ShipAddressAddr2', 'ShipAddressAddr3', 'ShipAddressAddr4', 'ShipAddressAddr5']].fillna('').apply(
-        lambda row: ' :: '.join([str(val).upper().strip() for val in row if str(val).strip() != '']), 
-        axis=1
-    )
+    orders['ShipAddress'] = join_non_empty_columns(orders, ['ShipAddressAddr2', 'ShipAddressAddr3', 'ShipAddressAddr4', 'ShipAddressAddr5'], ' :: ', upper=True, strip=True)
     orders.rename(columns=config['rename'], inplace=True)
     # --- orders Lines ---
     config = {
@@ -3531,69 +3852,117 @@ def build_process_params(secrets, folder_path):
     return params
 
 
+TOKEN_EXPIRY_MARGIN_SECONDS = 300
+_token_cache = {}
+_token_locks = {}
+_token_locks_lock = threading.Lock()
+
+
+def _get_token_lock(key):
+    with _token_locks_lock:
+        if key not in _token_locks:
+            _token_locks[key] = threading.Lock()
+        return _token_locks[key]
+
+
+def _token_is_fresh(expires_at):
+    return bool(expires_at) and time.time() < float(expires_at) - TOKEN_EXPIRY_MARGIN_SECONDS
+
+
+def write_json_atomic(file_path, data):
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as file:
+            json.dump(data, file, indent=2)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, file_path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
 def load_and_refresh_qbo_token(
     qbo_token_path,
     client_id,
     client_secret,
     redirect_uri,
-    environment
+    environment,
+    rejected_token=None
 ):
+    # Reuses the cached or saved access token until it is about to expire; pass rejected_token after a 401
     if not qbo_token_path:
         raise ValueError("qbo_token_path is required")
 
-    if os.path.exists(qbo_token_path):
-        with open(qbo_token_path, 'r') as file:
-            secrets = json.load(file)
-    else:
-        secrets = {}
-
-    access_token = secrets.get("access_token")
-    refresh_token = secrets.get("refresh_token")
-    realm = secrets.get("realm")
-    state = secrets.get("state")
-    auth_client = AuthClient(
-        client_id=client_id,
-        client_secret=client_secret,
-        redirect_uri=redirect_uri,
-        environment=environment,
-    )
-    if not access_token or not refresh_token or not realm or not state:
-        scopes = [
-            Scopes.ACCOUNTING,
-            Scopes.OPENID,
-        ]
-        auth_url = auth_client.get_authorization_url(scopes)
-        print("🔗 Go to this URL to authorize:")
-        print(auth_url)
-        redirect_response = input("\nPaste the FULL redirect URL here:\n")
-        parsed = urlparse(redirect_response)
-        params = parse_qs(parsed.query)
-        auth_code = params.get("code", [None])[0]
-        realm = params.get("realmId", [None])[0]
-        state = params.get("state", [None])[0]
-        if not auth_code or not realm:
-            raise ValueError("Missing code or realmId in redirect URL")
-        auth_client.get_bearer_token(auth_code, realm_id=realm)
-        access_token = auth_client.access_token
-        refresh_token = auth_client.refresh_token
-        log_message("[SUCCESS] QuickBooks first-time authorization complete")
-    else:
-        auth_client.refresh(refresh_token=refresh_token)
-        access_token = auth_client.access_token
-        refresh_token = auth_client.refresh_token
-        log_message("[SUCCESS] QuickBooks token refreshed")
+    with _get_token_lock(('qbo', os.path.abspath(qbo_token_path))):
+        cached = _token_cache.get(('qbo', os.path.abspath(qbo_token_path)))
+        if cached and cached['access_token'] != rejected_token and _token_is_fresh(cached['expires_at']):
+            return cached['access_token'], cached['realm']
 
-    updates = {
-        "access_token": access_token,
-        "refresh_token": refresh_token,
-        "realm": realm,
-        "state": state
-    }
-    updates = {k: v for k, v in updates.items() if v is not None}
-    secrets.update(updates)
-    with open(qbo_token_path, 'w') as file:
-        json.dump(secrets, file, indent=2)
-    log_message("[SUCCESS] QuickBooks credentials saved")
+        if os.path.exists(qbo_token_path):
+            with open(qbo_token_path, 'r') as file:
+                secrets = json.load(file)
+        else:
+            secrets = {}
+        original_secrets = dict(secrets)
+
+        access_token = secrets.get("access_token")
+        refresh_token = secrets.get("refresh_token")
+        realm = secrets.get("realm")
+        state = secrets.get("state")
+        expires_at = secrets.get("access_token_expires_at")
+        if access_token and realm and access_token != rejected_token and _token_is_fresh(expires_at):
+            _token_cache[('qbo', os.path.abspath(qbo_token_path))] = {'access_token': access_token, 'realm': realm, 'expires_at': float(expires_at)}
+            return access_token, realm
+
+        auth_client = AuthClient(
+            client_id=client_id,
+            client_secret=client_secret,
+            redirect_uri=redirect_uri,
+            environment=environment,
+        )
+        if not access_token or not refresh_token or not realm or not state:
+            scopes = [
+                Scopes.ACCOUNTING,
+                Scopes.OPENID,
+            ]
+            auth_url = auth_client.get_authorization_url(scopes)
+            print("🔗 Go to this URL to authorize:")
+            print(auth_url)
+            redirect_response = input("\nPaste the FULL redirect URL here:\n")
+            parsed = urlparse(redirect_response)
+            params = parse_qs(parsed.query)
+            auth_code = params.get("code", [None])[0]
+            realm = params.get("realmId", [None])[0]
+            state = params.get("state", [None])[0]
+            if not auth_code or not realm:
+                raise ValueError("Missing code or realmId in redirect URL")
+            auth_client.get_bearer_token(auth_code, realm_id=realm)
+            access_token = auth_client.access_token
+            refresh_token = auth_client.refresh_token
+            log_message("[SUCCESS] QuickBooks first-time authorization complete")
+        else:
+            auth_client.refresh(refresh_token=refresh_token)
+            access_token = auth_client.access_token
+            refresh_token = auth_client.refresh_token
+            log_message("[SUCCESS] QuickBooks token refreshed")
+        expires_at = time.time() + float(getattr(auth_client, 'expires_in', None) or 3600)
+
+        updates = {
+            "access_token": access_token,
+            "refresh_token": refresh_token,
+            "realm": realm,
+            "state": state,
+            "access_token_expires_at": expires_at
+        }
+        updates = {k: v for k, v in updates.items() if v is not None}
+        secrets.update(updates)
+        if secrets != original_secrets:
+            write_json_atomic(qbo_token_path, secrets)
+            log_message("[SUCCESS] QuickBooks credentials saved")
+        _token_cache[('qbo', os.path.abspath(qbo_token_path))] = {'access_token': access_token, 'realm': realm, 'expires_at': expires_at}
 
     return access_token, realm
 
@@ -3608,7 +3977,7 @@ def _stream_mssql(sql_query, conn, chunksize):
                 rows = cursor.fetchmany(chunksize)
                 if not rows:
                     break
-                yield [dict(zip(columns, row)) for row in rows], columns
+                yield dict(zip(columns, map(list, zip(*rows)))), columns
                 pbar.update(1)
     finally:
         cursor.close()
@@ -3624,7 +3993,7 @@ def _stream_qodbc(sql_query, conn, chunksize):
                 rows = cursor.fetchmany(chunksize)
                 if not rows:
                     break
-                yield [dict(zip(columns, r)) for r in rows], columns
+                yield dict(zip(columns, map(list, zip(*rows)))), columns
                 pbar.update(1)
                 time.sleep(0.01)
     finally:
@@ -3639,8 +4008,12 @@ def _stream_suiteql(
     token_key,
     token_secret,
     chunksize,
-    timeout_seconds
+    timeout_seconds,
+    max_in_flight=1,
+    max_retries=6
 ):
+    # With max_in_flight > 1, the pages after the first are fetched concurrently and still yielded in offset order
+    session = get_http_session()
     auth = OAuth1(
         consumer_key,
         consumer_secret,
@@ -3654,35 +4027,70 @@ def _stream_suiteql(
         'Accept': 'application/json',
         'Prefer': 'transient'
     }
-    offset = 0
-    has_more = True
-    total_results = 0
-    with tqdm(total=total_results, desc="Fetching data from NetSuite", unit="records") as pbar:
-        while has_more:
-            suiteql_url = f'https://{realm}.suitetalk.api.netsuite.com/services/rest/query/v1/suiteql?limit={chunksize}&offset={offset}'
-            response = requests.post(
+
+    def fetch_page(offset):
+        suiteql_url = f'https://{realm}.suitetalk.api.netsuite.com/services/rest/query/v1/suiteql?limit={chunksize}&offset={offset}'
+        for attempt in range(max_retries):
+            response = session.post(
                 suiteql_url,
                 auth=auth,
                 headers=headers,
                 json={"q": sql_query},
                 timeout=timeout_seconds
             )
+            if response.status_code == 429 or (response.status_code == 400 and 'CONCURRENCY_LIMIT_EXCEEDED' in response.text):
+                retry_after = response.headers.get('Retry-After')
+                wait = float(retry_after) if retry_after and retry_after.isdigit() else min(2 ** attempt, 60) + random.random()
+                log_message(f'[WARNING] SuiteQL concurrency limit hit at offset {offset}. Retrying in {wait:.1f}s ({attempt + 1}/{max_retries})...')
+                time.sleep(wait)
+                continue
             if response.status_code != 200:
                 raise Exception(f'SuiteQL Error: {response.status_code}, {response.text}')
-            result = response.json()
-            has_more = result.get('hasMore', False)
-            count = result.get('count', 0)
-            items = result.get('items', [])
-            if items:
-                raw_keys = list(dict.fromkeys(k for item in items for k in item.keys()))
-                columns = [str(k) for k in raw_keys]
-                yield [{col: item.get(col) for col in columns} for item in items], columns
-            offset += chunksize
-            total_results = result.get('totalResults', 0)
-            pbar.total = total_results
-            pbar.update(count)
+            return response.json()
+        raise Exception(f'SuiteQL Error: concurrency limit still exceeded at offset {offset} after {max_retries} retries')
+
+    def to_batch(result):
+        items = result.get('items', [])
+        raw_keys = list(dict.fromkeys(k for item in items for k in item.keys()))
+        columns = [str(k) for k in raw_keys]
+        return {col: [item.get(col) for item in items] for col in columns}, columns
+
+    with tqdm(total=0, desc="Fetching data from NetSuite", unit="records") as pbar:
+        def track(result):
+            pbar.total = result.get('totalResults', 0)
+            pbar.update(result.get('count', 0))
             pbar.refresh()
 
+        result = fetch_page(0)
+        track(result)
+        if result.get('items'):
+            yield to_batch(result)
+        offset = chunksize
+        has_more = result.get('hasMore', False)
+        total_results = result.get('totalResults', 0)
+        if has_more and max_in_flight > 1:
+            offsets = iter(range(chunksize, total_results, chunksize))
+            with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+                pending = deque((page_offset, executor.submit(fetch_page, page_offset)) for page_offset in islice(offsets, max_in_flight))
+                while pending:
+                    page_offset, future = pending.popleft()
+                    result = future.result()
+                    next_offset = next(offsets, None)
+                    if next_offset is not None:
+                        pending.append((next_offset, executor.submit(fetch_page, next_offset)))
+                    track(result)
+                    if result.get('items'):
+                        yield to_batch(result)
+                    offset = page_offset + chunksize
+                    has_more = result.get('hasMore', False)
+        while has_more:
+            result = fetch_page(offset)
+            track(result)
+            if result.get('items'):
+                yield to_batch(result)
+            offset += chunksize
+            has_more = result.get('hasMore', False)
+
 
 def _stream_qboapi(
     sql_query,
@@ -3714,7 +4122,7 @@ def _stream_qboapi(
         while has_more:
             paginated_query = f"{sql_query} STARTPOSITION {start_position} MAXRESULTS {chunksize}"
             qboapi_url = f"https://quickbooks.api.intuit.com/v3/company/{realm}/query?query={paginated_query}"
-            response = requests.get(
+            response = get_http_session().get(
                 qboapi_url,
                 headers=headers,
                 timeout=timeout_seconds
@@ -3729,10 +4137,11 @@ def _stream_qboapi(
                     client_id=client_id,
                     client_secret=client_secret,
                     redirect_uri=redirect_uri,
-                    environment=environment
+                    environment=environment,
+                    rejected_token=access_token
                 )
                 headers['Authorization'] = f'Bearer {access_token}'
-                response = requests.get(
+                response = get_http_session().get(
                     qboapi_url,
                     headers=headers,
                     timeout=timeout_seconds
@@ -3746,7 +4155,7 @@ def _stream_qboapi(
             if not table:
                 has_more = False
                 if first_loop:
-                    yield [], ["Id", "Metadata.Lastupdatedtime"]
+                    yield {"Id": [], "Metadata.Lastupdatedtime": []}, ["Id", "Metadata.Lastupdatedtime"]
                 break
             if table_name == 'RecurringTransaction':
                 rows = []
@@ -3758,7 +4167,7 @@ def _stream_qboapi(
                 df = pd.concat(rows, ignore_index=True)
             else:
                 df = pd.json_normalize(table)
-            yield df.to_dict(orient='records'), list(df.columns)
+            yield {col: df[col].tolist() for col in df.columns}, list(df.columns)
             first_loop = False
             pbar.update(1)
 
@@ -3791,10 +4200,314 @@ def _stream_bigquery(sql_query, project_id, credentials, chunksize, timeout_seco
         for chunk_df in df_iterator:
             if chunk_df.empty:
                 continue
-            yield chunk_df.to_dict(orient='records'), list(chunk_df.columns)
+            yield {col: chunk_df[col].tolist() for col in chunk_df.columns}, list(chunk_df.columns)
             pbar.update(1)
 
 
+def arrow_column_from_values(values, arrow_type=None):
+    values = [json.dumps(v, default=str) if isinstance(v, (dict, list)) else v for v in values]
+    # Only dropping sub-unit precision of dates and timestamps is allowed; numeric casts must not truncate
+    safe = arrow_type is None or not pa.types.is_temporal(arrow_type)
+    try:
+        # Inferring first and then casting keeps the cast checked; pa.array(values, type=...) truncates 100.5 to 100
+        column = pa.array(values, from_pandas=True)
+        if arrow_type is None and pa.types.is_decimal(column.type):
+            column = column.cast(pa.float64())
+        elif arrow_type is not None and column.type != arrow_type:
+            column = column.cast(arrow_type, safe=safe)
+        return column
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        pass
+    series = pd.Series([None if pd.isna(v) else (v.hex() if isinstance(v, bytes) else str(v)) for v in values], dtype=object)
+    if arrow_type is None or pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return pa.array(series, type=arrow_type or pa.string(), from_pandas=True)
+    if pa.types.is_timestamp(arrow_type) or pa.types.is_date(arrow_type):
+        coerced = pd.to_datetime(series, errors='coerce')
+    elif pa.types.is_boolean(arrow_type):
+        coerced = series.str.lower().map({'true': True, '1': True, 'false': False, '0': False})
+    else:
+        coerced = pd.to_numeric(series, errors='coerce')
+    try:
+        column = pa.array(coerced, type=arrow_type, from_pandas=True, safe=safe)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        # Checked casts value by value so that e.g. 100.5 into an int64 column becomes null rather than 100
+        converted = []
+        for value in coerced:
+            try:
+                converted.append(pa.array([value], from_pandas=True).cast(arrow_type, safe=safe)[0].as_py())
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError, OverflowError):
+                converted.append(None)
+        column = pa.array(converted, type=arrow_type)
+    invalid_count = int(series.notna().sum()) - (len(column) - column.null_count)
+    if invalid_count:
+        log_message(f'[WARNING] {invalid_count} value(s) could not be converted to {arrow_type} and were set to null.')
+    return column
+
+
+def _widen_arrow_type(current_type, new_type):
+    # Smallest common type for a column whose values drift between chunks
+    if current_type == new_type or pa.types.is_null(new_type):
+        return current_type
+    if pa.types.is_null(current_type):
+        return new_type
+    if pa.types.is_integer(current_type) and pa.types.is_integer(new_type):
+        return pa.int64()
+    if (pa.types.is_integer(current_type) or pa.types.is_floating(current_type)) and (pa.types.is_integer(new_type) or pa.types.is_floating(new_type)):
+        return pa.float64()
+    return pa.string()
+
+
+def batch_to_arrow_table(batch, columns, schema=None):
+    # batch is a columnar chunk from the _stream_* generators; with a schema, later chunks are aligned to it
+    row_count = len(batch[columns[0]]) if columns else 0
+    if schema is not None:
+        dropped = [col for col in columns if col not in schema.names]
+        if dropped:
+            log_message(f'[WARNING] Dropping columns not present in the first chunk: {dropped}')
+        columns = schema.names
+    arrays = []
+    for col in columns:
+        arrow_type = schema.field(col).type if schema is not None else None
+        column = arrow_column_from_values(batch.get(col, [None] * row_count), arrow_type)
+        if arrow_type is None and pa.types.is_null(column.type):
+            column = column.cast(pa.string())
+        arrays.append(column)
+    return pa.Table.from_arrays(arrays, names=list(columns))
+
+
+def dataframe_to_arrow_table(df):
+    arrays = []
+    for col in df.columns:
+        series = df[col]
+        if series.dtype == 'object':
+            column = arrow_column_from_values(series.tolist())
+        else:
+            column = pa.array(series, from_pandas=True)
+        if pa.types.is_null(column.type):
+            column = column.cast(pa.string())
+        arrays.append(column)
+    return pa.Table.from_arrays(arrays, names=[str(col) for col in df.columns])
+
+
+class _ParquetBatchWriter:
+    # Buffers stream batches into row groups of row_group_size. The first batch fixes the columns; their types are widened
+    # (int -> float64, anything else -> string) as later batches arrive until the first row group is written, after which
+    # batches are cast to the file schema and values that do not fit are set to null with a warning
+    def __init__(self, sink, compression='snappy', row_group_size=100000):
+        self.sink = sink
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self.writer = None
+        self.pending_tables = []
+        self.pending_rows = 0
+
+    def _widen_pending(self, table):
+        schema = self.pending_tables[0].schema
+        dropped = [name for name in table.schema.names if name not in schema.names]
+        if dropped:
+            log_message(f'[WARNING] Dropping columns not present in the first chunk: {dropped}')
+        arrays = []
+        fields = []
+        for field in schema:
+            pending_all_null = all(t.column(field.name).null_count == t.num_rows for t in self.pending_tables)
+            if field.name in table.schema.names:
+                column = table.column(field.name)
+                new_type = pa.null() if column.null_count == len(column) else column.type
+            else:
+                column = pa.nulls(table.num_rows, field.type)
+                new_type = pa.null()
+            target_type = new_type if pending_all_null and not pa.types.is_null(new_type) else _widen_arrow_type(field.type, new_type)
+            if target_type != field.type:
+                log_message(f'[INFO] Widening column "{field.name}" from {field.type} to {target_type}.')
+                self.pending_tables = [t.set_column(t.schema.get_field_index(field.name), field.name, t.column(field.name).cast(target_type, safe=False)) for t in self.pending_tables]
+            arrays.append(column.cast(target_type, safe=False))
+            fields.append(pa.field(field.name, target_type))
+        return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+    def write_batch(self, batch, columns):
+        if self.writer is not None:
+            table = batch_to_arrow_table(batch, columns, self.writer.schema)
+        else:
+            table = batch_to_arrow_table(batch, columns)
+            if self.pending_tables:
+                table = self._widen_pending(table)
+        self.pending_tables.append(table)
+        self.pending_rows += table.num_rows
+        if self.pending_rows >= self.row_group_size:
+            self.flush()
+        return table.num_rows
+
+    def flush(self):
+        if self.writer is None and self.pending_tables:
+            self.writer = pq.ParquetWriter(self.sink, self.pending_tables[0].schema, compression=self.compression)
+        if self.writer is not None and self.pending_tables:
+            self.writer.write_table(pa.concat_tables(self.pending_tables), row_group_size=self.row_group_size)
+        self.pending_tables = []
+        self.pending_rows = 0
+
+    def close(self):
+        self.flush()
+        if self.writer is not None:
+            self.writer.close()
+
+
+class _ByteSink:
+    def __init__(self):
+        self.buffer = bytearray()
+        self.position = 0
+        self.closed = False
+
+    def write(self, data):
+        self.buffer += data
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        data = bytes(self.buffer)
+        self.buffer.clear()
+        return data
+
+
+def stream_batches_to_s3(
+    data_generator,
+    bucket_name,
+    object_key,
+    s3_client,
+    output_format='csv',
+    compression='snappy',
+    row_group_size=100000,
+    part_size=8 * 1024 * 1024,
+    max_queue_parts=4
+):
+    # A producer thread encodes batches into parts while this thread uploads them, so memory stays near
+    # (max_queue_parts + 2) * part_size and no local file is written
+    part_size = max(part_size, 5 * 1024 * 1024)
+    parts_queue = queue.Queue(maxsize=max_queue_parts)
+    stop = threading.Event()
+    stats = {'rows': 0, 'bytes': 0}
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                parts_queue.put(item, timeout=1)
+                return
+            except queue.Full:
+                continue
+
+    def produce():
+        sink = _ByteSink()
+        try:
+            if output_format == 'parquet':
+                parquet_writer = _ParquetBatchWriter(sink, compression, row_group_size)
+            else:
+                text_buffer = io.StringIO()
+                csv_writer = csv.writer(text_buffer, quoting=csv.QUOTE_ALL)
+            first_chunk = True
+            for batch, columns in data_generator:
+                if stop.is_set():
+                    return
+                if output_format == 'parquet':
+                    stats['rows'] += parquet_writer.write_batch(batch, columns)
+                else:
+                    if first_chunk:
+                        csv_writer.writerow(columns)
+                    rows = list(zip(*[[str(v) for v in batch[col]] for col in columns]))
+                    csv_writer.writerows(rows)
+                    stats['rows'] += len(rows)
+                    sink.write(text_buffer.getvalue().encode('utf-8'))
+                    text_buffer.seek(0)
+                    text_buffer.truncate()
+                first_chunk = False
+                if len(sink.buffer) >= part_size:
+                    put(sink.drain())
+            if output_format == 'parquet':
+                parquet_writer.close()
+            if sink.buffer:
+                put(sink.drain())
+            put(None)
+        except BaseException as e:
+            put(e)
+        finally:
+            # Closing here, on the thread that iterates it, runs the source's cleanup (e.g. cursor.close()) before join returns
+            close = getattr(data_generator, 'close', None)
+            if close:
+                close()
+
+    producer = threading.Thread(target=produce, name=f'extract-{object_key}', daemon=True)
+    producer.start()
+    upload_id = None
+    parts = []
+    started = time.perf_counter()
+    progress = tqdm(unit='B', unit_scale=True, desc=f'Streaming "{object_key}" to S3')
+    try:
+        pending_part = None
+        while True:
+            item = parts_queue.get()
+            if isinstance(item, BaseException):
+                raise item
+            if item is not None and pending_part is None and upload_id is None:
+                pending_part = item
+                continue
+            if item is None and upload_id is None and pending_part is None:
+                # Nothing was extracted; like the file-based path, an empty object is not uploaded
+                log_message(f'[WARNING] No data extracted for "{object_key}"; skipping upload.')
+                break
+            if item is None and upload_id is None:
+                s3_client.put_object(Bucket=bucket_name, Key=object_key, Body=pending_part or b'')
+                stats['bytes'] += len(pending_part or b'')
+                progress.update(len(pending_part or b''))
+                break
+            if upload_id is None:
+                upload_id = s3_client.create_multipart_upload(Bucket=bucket_name, Key=object_key)['UploadId']
+            for part in ([pending_part] if pending_part is not None else []) + ([item] if item is not None else []):
+                response = s3_client.upload_part(
+                    Bucket=bucket_name,
+                    Key=object_key,
+                    PartNumber=len(parts) + 1,
+                    UploadId=upload_id,
+                    Body=part
+                )
+                parts.append({'PartNumber': len(parts) + 1, 'ETag': response['ETag']})
+                stats['bytes'] += len(part)
+                progress.update(len(part))
+            pending_part = None
+            if item is None:
+                s3_client.complete_multipart_upload(
+                    Bucket=bucket_name,
+                    Key=object_key,
+                    UploadId=upload_id,
+                    MultipartUpload={'Parts': parts}
+                )
+                break
+    except BaseException:
+        stop.set()
+        if upload_id is not None:
+            abort_multipart_upload(s3_client, bucket_name, object_key, upload_id)
+        raise
+    finally:
+        # The producer must be finished with the source connection before the caller closes or reuses it
+        stop.set()
+        while producer.is_alive():
+            try:
+                parts_queue.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        producer.join()
+        progress.close()
+    elapsed = time.perf_counter() - started
+    log_message(f'[INFO] Streamed {stats["rows"]} rows ({stats["bytes"] / 1024 / 1024:.1f} MB) to "{object_key}" in {elapsed:.2f}s using {max(len(parts), 1)} part(s).')
+    return stats
+
+
 class PartialDataLoadError(Exception):
     def __init__(self, message, partial_data):
         super().__init__(message)
@@ -3821,8 +4534,16 @@ def load_data_via_query(
         redirect_uri=None,
         environment=None,
         qbo_token_path=None,
-        timeout_seconds=900
+        timeout_seconds=900,
+        output_format='csv',
+        compression='snappy',
+        row_group_size=100000,
+        s3_client=None,
+        bucket_name=None,
+        object_key=None,
+        suiteql_max_in_flight=1
 ):
+    # With s3_client, bucket_name and object_key set, chunks are streamed straight into S3 and the upload stats are returned
     log_message(f'[INFO] Running {sql_query} via {source_type}')
     conn = active_conn
     should_close_conn = False
@@ -3830,6 +4551,7 @@ def load_data_via_query(
         if not connection_string:
             raise ValueError(f'Either active_conn or connection_string must be provided for the "{source_type}" source type')
         conn = pyodbc.connect(connection_string, autocommit=True, timeout=timeout_seconds)
+        should_close_conn = True
 
     try:
         if source_type == "mssql":
@@ -3861,7 +4583,8 @@ def load_data_via_query(
                 token_key,
                 token_secret,
                 chunksize,
-                timeout_seconds
+                timeout_seconds,
+                max_in_flight=suiteql_max_in_flight
             )
         elif source_type == "qboapi":
             data_generator = _stream_qboapi(
@@ -3877,39 +4600,69 @@ def load_data_via_query(
         else:
             raise ValueError(f"Unknown source_type: {source_type}")
 
+        if s3_client is not None and object_key:
+            return stream_batches_to_s3(
+                data_generator,
+                bucket_name,
+                object_key,
+                s3_client,
+                output_format=output_format,
+                compression=compression,
+                row_group_size=row_group_size
+            )
+        if file_path and output_format == 'parquet':
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            parquet_writer = _ParquetBatchWriter(file_path, compression, row_group_size)
+            try:
+                for batch, columns in data_generator:
+                    parquet_writer.write_batch(batch, columns)
+            finally:
+                parquet_writer.close()
+            return None
         if file_path:
             if os.path.exists(file_path):
                 os.remove(file_path)
             first_chunk = True
             with open(file_path, 'w', newline='', encoding=encoding) as f:
-                writer = csv.writer(f)
-                for chunk_data, columns in data_generator:
+                writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+                for batch, columns in data_generator:
                     if first_chunk:
                         writer.writerow(columns)
                         first_chunk = False
-                    for row in chunk_data:
-                        if isinstance(row, dict):
-                            writer.writerow([str(row.get(col, '')) for col in columns])
-                        else:
-                            writer.writerow([str(v) for v in row])
+                    writer.writerows(zip(*[[str(v) for v in batch[col]] for col in columns]))
             return None
-        all_chunks = []
+        column_data = {}
+        row_count = 0
         try:
-            for chunk_data, _ in data_generator:
-                all_chunks.extend(chunk_data)
+            for batch, columns in data_generator:
+                for col in columns:
+                    if col not in column_data:
+                        column_data[col] = [np.nan] * row_count
+                    column_data[col].extend(batch[col])
+                row_count += len(batch[columns[0]]) if columns else 0
+                for values in column_data.values():
+                    if len(values) < row_count:
+                        values.extend([np.nan] * (row_count - len(values)))
         except Exception as e:
-            if all_chunks:
-                raise PartialDataLoadError(str(e), pd.DataFrame(all_chunks)) from e
+            if row_count:
+                raise PartialDataLoadError(str(e), pd.DataFrame(column_data)) from e
             raise
-        if not all_chunks:
+        if not row_count:
             return pd.DataFrame()
-        return pd.DataFrame(all_chunks)
+        return pd.DataFrame(column_data)
 
     finally:
         if should_close_conn and conn:
             conn.close()
 
 
+def count_csv_rows(file_path, encoding='utf-8'):
+    # Data rows of a CSV written by load_data_via_query; quoted fields may span lines, so lines are not counted directly
+    with open(file_path, newline='', encoding=encoding) as f:
+        return max(sum(1 for _ in csv.reader(f)) - 1, 0)
+
+
 def execute_with_retry(
     query,
     params,
@@ -3917,9 +4670,14 @@ def execute_with_retry(
     source_type,
     connection_string,
     table,
-    timeout_seconds=900
+    timeout_seconds=900,
+    shared_params=None
 ):
+    # shared_params holds the run-wide connection: a QODBC reconnect is written back there so later tables use it too
+    shared_params = params if shared_params is None else shared_params
     for attempt in range(max_retries):
+        if params.get("active_conn") is not None and shared_params.get("active_conn") is not None:
+            params = dict(params, active_conn=shared_params["active_conn"])
         try:
             result = load_data_via_query(sql_query=query, **params)
             log_message(f'[SUCCESS] Table "{table}" retrieved from {source_type} !')
@@ -3937,18 +4695,43 @@ def execute_with_retry(
             if source_type == "qodbc":
                 kill_qb_processes()
                 timer_and_alert(20)
+                try:
+                    shared_params["active_conn"].close()
+                except:
+                    pass
                 active_conn = pyodbc.connect(connection_string, autocommit=True, timeout=timeout_seconds)
-                params["active_conn"] = active_conn
+                shared_params["active_conn"] = active_conn
+                params = dict(params, active_conn=active_conn)
             else:
                 timer_and_alert(60)
     log_message(f'[ERROR] All retries failed for table "{table}".')
     return None
 
 
-def s3_object_exists(s3_client, bucket, key):
-    try:
-        s3_client.head_object(Bucket=bucket, Key=key)
-        return True
+SOURCE_CONCURRENCY_LIMITS = {
+    # kill_qb_processes is machine-wide and QODBC connections can't be shared, so QuickBooks desktop stays serial
+    "qodbc": 1,
+    "mssql": 4,
+    "suiteql": 4,
+    "qboapi": 2,
+    "bigquery": 8,
+}
+_source_semaphores = {}
+_source_semaphores_lock = threading.Lock()
+
+
+def get_source_semaphore(source_type):
+    # Shared across process_data_to_s3 calls so parallel callers still respect the per-source limit
+    with _source_semaphores_lock:
+        if source_type not in _source_semaphores:
+            _source_semaphores[source_type] = threading.BoundedSemaphore(SOURCE_CONCURRENCY_LIMITS.get(source_type, 1))
+        return _source_semaphores[source_type]
+
+
+def s3_object_exists(s3_client, bucket, key):
+    try:
+        s3_client.head_object(Bucket=bucket, Key=key)
+        return True
     except s3_client.exceptions.ClientError as e:
         if e.response['Error']['Code'] == "404":
             return False
@@ -4042,8 +4825,24 @@ def process_data_to_s3(
     redirect_uri=None,
     environment=None,
     qbo_token_path=None,
-    timeout_seconds=900
+    timeout_seconds=900,
+    output_format='csv',
+    compression='snappy',
+    row_group_size=100000,
+    max_workers=1,
+    stream_upload=False,
+    suiteql_max_in_flight=1,
+    raise_on_failure=False
 ):
+    # Failed tables are logged and reported in the returned summary; raise_on_failure=True is an opt-in that also raises
+    # after the summary is logged when any table failed
+    # stream_upload pipes full-refresh extracts straight into an S3 multipart upload instead of a DataFrame or file_path
+    # Tables run concurrently on up to max_workers threads (None uses the source limit), capped by SOURCE_CONCURRENCY_LIMITS
+    if output_format not in ('csv', 'parquet'):
+        raise ValueError(f"Unsupported output_format: {output_format}. Use 'csv' or 'parquet'.")
+    source_limit = SOURCE_CONCURRENCY_LIMITS.get(source_type, 1)
+    max_workers = max(1, min(max_workers or source_limit, source_limit, len(tables) or 1))
+    source_slot = get_source_semaphore(source_type)
     active_conn = None
     try:
         params = {
@@ -4052,6 +4851,9 @@ def process_data_to_s3(
             "file_path": file_path,
             "encoding": encoding,
             "timeout_seconds": timeout_seconds,
+            "output_format": output_format,
+            "compression": compression,
+            "row_group_size": row_group_size,
         }
         if source_type in ["qodbc", "mssql"]:
             if source_type == "qodbc":
@@ -4080,6 +4882,7 @@ def process_data_to_s3(
                     "consumer_secret": consumer_secret,
                     "token_key": token_key,
                     "token_secret": token_secret,
+                    "suiteql_max_in_flight": suiteql_max_in_flight,
                 }
             )
         elif source_type == "qboapi":
@@ -4096,8 +4899,17 @@ def process_data_to_s3(
         else:
             raise ValueError(f'Unsupported source: "{source_type}"')
 
-        for table, table_info in tables.items():
-            object_key = table + '.csv'
+        def process_table(table, table_info):
+            object_key = f'{table}.{output_format}'
+            table_file_path = file_path
+            if file_path and max_workers > 1:
+                base_path, extension = os.path.splitext(file_path)
+                table_file_path = f'{base_path}_{re.sub(r"[^A-Za-z0-9_.-]", "_", table)}{extension}'
+            table_params = dict(params, file_path=table_file_path)
+            if source_type == "mssql" and max_workers > 1:
+                table_params["active_conn"] = None
+                table_params["connection_string"] = connection_string
+            result = {'table': table, 'object_key': object_key, 'status': 'failed', 'rows': None, 'error': 'extraction failed'}
 
             if isinstance(table_info, dict):
                 id_column = table_info.get("id_column")
@@ -4140,12 +4952,13 @@ def process_data_to_s3(
                         """
                         duplicated_ids = execute_with_retry(
                             dup_query,
-                            params,
+                            table_params,
                             max_retries=1,
                             source_type=source_type,
                             connection_string=connection_string,
                             table=table,
-                            timeout_seconds=timeout_seconds
+                            timeout_seconds=timeout_seconds,
+                            shared_params=params
                         )
                         if duplicated_ids is not None and not duplicated_ids.empty:
                             log_message(f"[WARNING] Duplicate IDs ({id_column}) found in {table}")
@@ -4159,6 +4972,7 @@ def process_data_to_s3(
                         s3_client=s3_client,
                         bucket_name=bucket_name,
                         object_key=object_key,
+                        file_type=output_format,
                         low_memory=False
                     )
                 else:
@@ -4173,15 +4987,16 @@ def process_data_to_s3(
                     )
                     df = execute_with_retry(
                         init_query,
-                        params,
+                        table_params,
                         max_retries,
                         source_type,
                         connection_string,
                         table,
-                        timeout_seconds=timeout_seconds
+                        timeout_seconds=timeout_seconds,
+                        shared_params=params
                     )
                     if df is None:
-                        continue
+                        return result
                 if df.empty or (last_modified_column not in df.columns):
                     log_message(f'[WARNING] Table "{table}" is empty or missing "{last_modified_column}". Skipping incremental loop.')
                     has_more_records = False
@@ -4219,12 +5034,13 @@ def process_data_to_s3(
                     )
                     new_records = execute_with_retry(
                         inc_query,
-                        params,
+                        table_params,
                         max_retries,
                         source_type,
                         connection_string,
                         table,
-                        timeout_seconds=timeout_seconds
+                        timeout_seconds=timeout_seconds,
+                        shared_params=params
                     )
 
                     if (
@@ -4257,7 +5073,7 @@ def process_data_to_s3(
                         df = df.sort_values(by=last_modified_column, ascending=False)
                         df = df.drop_duplicates(keep='first')
                     df.reset_index(drop=True, inplace=True)
-                    if partial_load_error and not file_path:
+                    if partial_load_error and not table_file_path:
                         try:
                             upload_to_s3(
                                 data=df,
@@ -4266,7 +5082,10 @@ def process_data_to_s3(
                                 s3_client=s3_client,
                                 CreateS3Bucket=CreateS3Bucket,
                                 aws_region=aws_region,
-                                encoding=encoding
+                                encoding=encoding,
+                                output_format=output_format,
+                                compression=compression,
+                                row_group_size=row_group_size
                             )
                             log_message(
                                 f'[SUCCESS] Uploaded cleaned partial "{object_key}" after retrieval error; retrying.'
@@ -4284,21 +5103,45 @@ def process_data_to_s3(
             else:
                 log_message(f'[INFO] Table "{table}": Performing Full Table Refresh...')
                 full_query = defined_query if defined_query else f"SELECT * FROM {table}"
+                if stream_upload:
+                    if CreateS3Bucket:
+                        create_s3_bucket_if_missing(s3_client, bucket_name, aws_region)
+                    stats = execute_with_retry(
+                        full_query,
+                        dict(table_params, file_path=None, s3_client=s3_client, bucket_name=bucket_name, object_key=object_key),
+                        max_retries,
+                        source_type,
+                        connection_string,
+                        table,
+                        timeout_seconds=timeout_seconds,
+                        shared_params=params
+                    )
+                    if stats is None:
+                        log_message(f'[ERROR] Table "{table}": Failed to stream full dataset to S3.')
+                        return result
+                    if not stats['bytes']:
+                        log_message(f'[ERROR] Table "{table}": No data extracted. Skipping upload.')
+                        return result
+                    result.update(status='loaded', rows=stats['rows'], error=None)
+                    log_message(f'[SUCCESS] "{object_key}" table is loaded to S3 "{bucket_name}" bucket!')
+                    return result
 
                 df = execute_with_retry(
                     full_query,
-                    params,
+                    table_params,
                     max_retries,
                     source_type,
                     connection_string,
                     table,
-                    timeout_seconds=timeout_seconds
+                    timeout_seconds=timeout_seconds,
+                    shared_params=params
                 )
-                if df is None and not file_path:
+                if df is None and not table_file_path:
                     log_message(f'[ERROR] Table "{table}": Failed to extract full dataset. Skipping upload.')
-                    continue
+                    return result
             try:
-                if not file_path:
+                if not table_file_path:
+                    result['rows'] = df.shape[0]
                     upload_to_s3(
                         data=df,
                         bucket_name=bucket_name,
@@ -4306,12 +5149,15 @@ def process_data_to_s3(
                         s3_client=s3_client,
                         CreateS3Bucket=CreateS3Bucket,
                         aws_region=aws_region,
-                        encoding=encoding
+                        encoding=encoding,
+                        output_format=output_format,
+                        compression=compression,
+                        row_group_size=row_group_size
                     )
                 else:
-                    if not os.path.exists(file_path) or not os.path.getsize(file_path):
-                        log_message(f'[ERROR] File "{file_path}" is missing or empty!')
-                        continue
+                    if not os.path.exists(table_file_path) or not os.path.getsize(table_file_path):
+                        log_message(f'[ERROR] File "{table_file_path}" is missing or empty!')
+                        return result
                     upload_to_s3(
                         data=None,
                         bucket_name=bucket_name,
@@ -4319,26 +5165,75 @@ def process_data_to_s3(
                         s3_client=s3_client,
                         CreateS3Bucket=CreateS3Bucket,
                         aws_region=aws_region,
-                        file_path=file_path,
-                        encoding=encoding
+                        file_path=table_file_path,
+                        encoding=encoding,
+                        output_format=output_format
                     )
+                    if output_format == 'parquet':
+                        result['rows'] = pq.ParquetFile(table_file_path).metadata.num_rows
+                    else:
+                        result['rows'] = count_csv_rows(table_file_path, encoding)
+                    if table_file_path != file_path:
+                        os.remove(table_file_path)
+                result['status'] = 'loaded'
+                result['error'] = None
                 log_message(f'[SUCCESS] "{object_key}" table is loaded to S3 "{bucket_name}" bucket!')
             except Exception as e:
+                result['error'] = str(e)
                 log_message(f'[ERROR] Failed to load table "{object_key}" to S3 bucket "{bucket_name}". Error: {str(e)}')
 
-            if 'df' in locals():
-                del df
-            if 'new_records' in locals():
-                del new_records
+            return result
+
+        def run_table(table, table_info):
+            started = time.perf_counter()
+            with source_slot:
+                try:
+                    result = process_table(table, table_info)
+                except Exception as e:
+                    log_message(f'[ERROR] Table "{table}" failed. Error: {str(e)}')
+                    result = {'table': table, 'object_key': None, 'status': 'failed', 'rows': None, 'error': str(e)}
+            result['seconds'] = round(time.perf_counter() - started, 2)
             gc.collect()
+            return result
+
+        if max_workers == 1:
+            results = [run_table(table, table_info) for table, table_info in tables.items()]
+        else:
+            log_message(f'[INFO] Extracting {len(tables)} tables from {source_type} with {max_workers} workers...')
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(run_table, table, table_info) for table, table_info in tables.items()]
+                results = [future.result() for future in futures]
+        summary = pd.DataFrame(results, columns=['table', 'object_key', 'status', 'rows', 'seconds', 'error'])
+        log_message(
+            f'[INFO] {source_type} extraction summary: {(summary["status"] == "loaded").sum()}/{len(summary)} tables loaded '
+            f'in {summary["seconds"].sum():.1f}s of table time.\n{summary.to_string(index=False)}'
+        )
+        failed_tables = summary.loc[summary["status"] == "failed", "table"].tolist()
+        if failed_tables and raise_on_failure:
+            raise Exception(f'{len(failed_tables)} {source_type} table(s) failed to load: {failed_tables}')
+        return summary
 
     finally:
+        # A QODBC reconnect replaces params["active_conn"], so close whichever connection is current
         try:
-            active_conn.close()
+            params["active_conn"].close()
         except:
             pass
 
 
+def create_s3_bucket_if_missing(s3_client, bucket_name, aws_region=None):
+    try:
+        buckets = s3_client.list_buckets()["Buckets"]
+        buckets = [bucket['Name'] for bucket in buckets]
+        if bucket_name not in buckets:
+            s3_client.create_bucket(Bucket=bucket_name, CreateBucketConfiguration={'LocationConstraint': aws_region})
+            log_message(f'[SUCCESS] Bucket "{bucket_name}" created!')
+        else:
+            log_message(f'[INFO] Bucket "{bucket_name}" already exists.')
+    except Exception as e:
+        log_message(f'[ERROR] Failed to create bucket "{bucket_name}". Error: {str(e)}.')
+
+
 def upload_to_s3(
     data,
     bucket_name,
@@ -4346,23 +5241,32 @@ def upload_to_s3(
     s3_client,
     CreateS3Bucket=False,
     aws_region=None,
-    chunk_size=5 * 1024 * 1024,
+    chunk_size=8 * 1024 * 1024,
     file_path=None,
-    encoding='utf-8'
+    encoding='utf-8',
+    max_concurrency=8,
+    upload_id=None,
+    abort_on_failure=True,
+    output_format='csv',
+    compression='snappy',
+    row_group_size=100000
 ):
 
     if CreateS3Bucket:
-        try:
-            buckets = s3_client.list_buckets()["Buckets"]
-            buckets = [bucket['Name'] for bucket in buckets]
-            if bucket_name not in buckets:
-                s3_client.create_bucket(Bucket=bucket_name, CreateBucketConfiguration={'LocationConstraint': aws_region})
-                log_message(f'[SUCCESS] Bucket "{bucket_name}" created!')
-            else:
-                log_message(f'[INFO] Bucket "{bucket_name}" already exists.')
-        except Exception as e:
-            log_message(f'[ERROR] Failed to create bucket "{bucket_name}". Error: {str(e)}.')
-    if not file_path:
+        create_s3_bucket_if_missing(s3_client, bucket_name, aws_region)
+    if not file_path and output_format == 'parquet':
+        parquet_buffer = io.BytesIO()
+        pq.write_table(dataframe_to_arrow_table(data), parquet_buffer, compression=compression, row_group_size=row_group_size)
+        data_size = parquet_buffer.tell()
+        parquet_buffer.seek(0)
+        with tqdm(total=data_size, unit='B', unit_scale=True, desc=f'Uploading "{object_key}" to S3') as progress:
+            s3_client.upload_fileobj(
+                Fileobj=parquet_buffer,
+                Bucket=bucket_name,
+                Key=object_key,
+                Callback=progress.update
+            )
+    elif not file_path:
         for idx, dtype in enumerate(data.dtypes):
             if dtype == 'object' or dtype.name == 'string':
                 data.iloc[:, idx] = (
@@ -4387,54 +5291,242 @@ def upload_to_s3(
                 Callback=callback
         )
     else:
-        multipart_upload = s3_client.create_multipart_upload(Bucket=bucket_name, Key=object_key)
-        parts = []
-        part_number = 1
-        total_bytes_uploaded = 0
-        file_size = os.path.getsize(file_path)
-        progress = tqdm(total=file_size, unit='MB', desc=f'Uploading "{object_key}" to S3')
-        def upload_part(buffer, part_number):
-            nonlocal total_bytes_uploaded
-            buffer.seek(0)
+        upload_file_multipart(
+            file_path=file_path,
+            bucket_name=bucket_name,
+            object_key=object_key,
+            s3_client=s3_client,
+            part_size=chunk_size,
+            max_concurrency=max_concurrency,
+            encoding=encoding if output_format == 'csv' else 'utf-8',
+            upload_id=upload_id,
+            abort_on_failure=abort_on_failure
+        )
+
+
+def upload_file_multipart(
+    file_path,
+    bucket_name,
+    object_key,
+    s3_client,
+    part_size=8 * 1024 * 1024,
+    max_concurrency=8,
+    encoding='utf-8',
+    upload_id=None,
+    abort_on_failure=True
+):
+    # Uploads the file bytes as-is; pass the UploadId of a failed run as upload_id to skip parts S3 already has
+    if codecs.lookup(encoding).name not in ('utf-8', 'ascii'):
+        fd, utf8_path = tempfile.mkstemp(suffix=os.path.splitext(file_path)[1])
+        os.close(fd)
+        try:
+            with open(file_path, 'r', encoding=encoding, newline='') as src_file, open(utf8_path, 'w', encoding='utf-8', newline='') as dst_file:
+                shutil.copyfileobj(src_file, dst_file, 1024 * 1024)
+            return upload_file_multipart(utf8_path, bucket_name, object_key, s3_client, part_size, max_concurrency, 'utf-8', upload_id, abort_on_failure)
+        finally:
+            os.remove(utf8_path)
+    file_size = os.path.getsize(file_path)
+    if file_size == 0:
+        return s3_client.put_object(Bucket=bucket_name, Key=object_key, Body=b'')
+    part_size = max(part_size, 5 * 1024 * 1024, -(-file_size // 10000))
+    ranges = {part_number: (start, min(start + part_size, file_size)) for part_number, start in enumerate(range(0, file_size, part_size), start=1)}
+    completed_parts = {}
+    if upload_id:
+        paginator = s3_client.get_paginator('list_parts')
+        for page in paginator.paginate(Bucket=bucket_name, Key=object_key, UploadId=upload_id):
+            for part in page.get('Parts', []):
+                start, end = ranges.get(part['PartNumber'], (0, -1))
+                if part['Size'] == end - start:
+                    completed_parts[part['PartNumber']] = {'PartNumber': part['PartNumber'], 'ETag': part['ETag']}
+        log_message(f'[INFO] Resuming upload {upload_id} of "{object_key}": {len(completed_parts)}/{len(ranges)} parts already uploaded.')
+    else:
+        upload_id = s3_client.create_multipart_upload(Bucket=bucket_name, Key=object_key)['UploadId']
+    progress = tqdm(total=file_size, unit='B', unit_scale=True, desc=f'Uploading "{object_key}" to S3')
+    progress.update(sum(ranges[part_number][1] - ranges[part_number][0] for part_number in completed_parts))
+    progress_lock = threading.Lock()
+    started = time.perf_counter()
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+        def upload_part(part_number):
+            start, end = ranges[part_number]
             response = s3_client.upload_part(
                 Bucket=bucket_name,
                 Key=object_key,
                 PartNumber=part_number,
-                UploadId=multipart_upload['UploadId'],
-                Body=buffer
+                UploadId=upload_id,
+                Body=mapped_file[start:end]
             )
-            uploaded_size = buffer.tell()
-            total_bytes_uploaded += uploaded_size
-            progress.update(uploaded_size)
+            with progress_lock:
+                progress.update(end - start)
             return {
                 'PartNumber': part_number,
                 'ETag': response['ETag']
             }
-        with open(file_path, 'r', encoding=encoding) as csv_file:
-            csv_reader = csv.reader(csv_file)
-            headers = next(csv_reader)
-            csv_buffer = io.StringIO()
-            writer = csv.writer(csv_buffer, quoting=csv.QUOTE_ALL)
-            writer.writerow(headers)
-            for row in csv_reader:
-                writer.writerow(row)
-                if csv_buffer.tell() >= chunk_size:
-                    part = upload_part(io.BytesIO(csv_buffer.getvalue().encode()), part_number)
-                    parts.append(part)
-                    part_number += 1
-                    csv_buffer = io.StringIO()
-                    writer = csv.writer(csv_buffer, quoting=csv.QUOTE_ALL)
-                    # writer.writerow(headers)
-            if csv_buffer.tell() > 0:
-                part = upload_part(io.BytesIO(csv_buffer.getvalue().encode()), part_number)
-                parts.append(part)
-        progress.close()
-        s3_client.complete_multipart_upload(
-            Bucket=bucket_name,
-            Key=object_key,
-            UploadId=multipart_upload['UploadId'],
-            MultipartUpload={'Parts': parts}
-        )
+        try:
+            with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                futures = [executor.submit(upload_part, part_number) for part_number in ranges if part_number not in completed_parts]
+                try:
+                    for future in as_completed(futures):
+                        part = future.result()
+                        completed_parts[part['PartNumber']] = part
+                except Exception:
+                    for future in futures:
+                        future.cancel()
+                    raise
+        except Exception as e:
+            progress.close()
+            if abort_on_failure:
+                abort_multipart_upload(s3_client, bucket_name, object_key, upload_id)
+            else:
+                log_message(f'[ERROR] Upload of "{object_key}" failed: {e}. Pass upload_id="{upload_id}" to resume it.')
+            raise
+    progress.close()
+    response = s3_client.complete_multipart_upload(
+        Bucket=bucket_name,
+        Key=object_key,
+        UploadId=upload_id,
+        MultipartUpload={'Parts': [completed_parts[part_number] for part_number in sorted(completed_parts)]}
+    )
+    elapsed = time.perf_counter() - started
+    log_message(f'[INFO] Uploaded "{object_key}" ({file_size / 1024 / 1024:.1f} MB) in {elapsed:.2f}s at {file_size / 1024 / 1024 / max(elapsed, 1e-9):.1f} MB/s using {len(ranges)} parts on {max_concurrency} streams.')
+    return response
+
+
+def abort_multipart_upload(s3_client, bucket_name, object_key, upload_id):
+    try:
+        s3_client.abort_multipart_upload(Bucket=bucket_name, Key=object_key, UploadId=upload_id)
+        log_message(f'[INFO] Aborted multipart upload {upload_id} of "{object_key}".')
+    except Exception as e:
+        log_message(f'[ERROR] Failed to abort multipart upload {upload_id} of "{object_key}": {e}')
+
+
+def abort_orphaned_multipart_uploads(
+    s3_client,
+    bucket_name,
+    prefix='',
+    older_than=timedelta(days=1)
+):
+    cutoff = datetime.now(pytz.utc) - older_than
+    aborted = 0
+    paginator = s3_client.get_paginator('list_multipart_uploads')
+    for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+        for upload in page.get('Uploads', []):
+            if upload['Initiated'] < cutoff:
+                abort_multipart_upload(s3_client, bucket_name, upload['Key'], upload['UploadId'])
+                aborted += 1
+    log_message(f'[INFO] Aborted {aborted} orphaned multipart upload(s) in bucket "{bucket_name}".')
+    return aborted
+
+
+def _age_group_bins(
+    quantile_values
+):
+    # pd.cut bins and labels matching group(): ages up to quantile_values[1] land in the first bin, above quantile_values[4] in the last
+    right_edges = list(quantile_values[1:5]) + [np.inf]
+    labels = [f"{quantile_values[0]:03}-{quantile_values[1]:03}"]
+    labels += [f"{quantile_values[i]+1:03}-{quantile_values[i+1]:03}" for i in range(1, 4)]
+    labels.append(f"{quantile_values[4]+1:03}+")
+    # Tied quantiles give empty bins, which pd.cut rejects; as in group(), those ages go to the first bin with that edge
+    kept = [i for i in range(len(right_edges)) if i == 0 or right_edges[i] != right_edges[i-1]]
+    return [-np.inf] + [right_edges[i] for i in kept], [labels[i] for i in kept]
+
+
+def _open_case_intervals(
+    df,
+    min_date,
+    max_date,
+    openDateCol,
+    closeDateCol
+):
+    # Each case is open on days [first, last) counted from min_date, clipped to the reporting window; age0 is its age on day first
+    day_ns = 86400 * 10**9
+    n_days = max((max_date - min_date) // pd.Timedelta(days=1) + 1, 0)
+    open_ns = (df[openDateCol] - min_date).to_numpy(dtype='timedelta64[ns]').astype(np.int64)
+    close_delta = (df[closeDateCol] - min_date).to_numpy(dtype='timedelta64[ns]')
+    first = -(-open_ns // day_ns)
+    last = np.where(np.isnat(close_delta), n_days, np.minimum(-(-close_delta.astype(np.int64) // day_ns), n_days))
+    last = np.maximum(last, first)
+    age0 = (first * day_ns - open_ns) // day_ns
+    return first, last, age0, n_days
+
+
+def _expand_open_cases(
+    df,
+    min_date,
+    idCol,
+    first,
+    last,
+    age0
+):
+    # One row per case and open day, ordered by day and then by the case's position in df
+    counts = last - first
+    rows = np.repeat(np.arange(len(df)), counts)
+    step = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    day_index = first[rows] + step
+    order = np.lexsort((rows, day_index))
+    rows, day_index, age = rows[order], day_index[order], (age0[rows] + step)[order]
+    ids = df[idCol].to_numpy()[rows]
+    if df[idCol].duplicated().any():
+        # A case id open more than once on a day is counted from its first row only
+        keep = ~pd.DataFrame({'day': day_index, 'id': ids}).duplicated().to_numpy()
+        day_index, age, ids = day_index[keep], age[keep], ids[keep]
+    return pd.DataFrame({
+        'Date': min_date + pd.to_timedelta(day_index, unit='D'),
+        'Age': age,
+        idCol: pd.Series(ids, dtype=df[idCol].dtype)
+    })
+
+
+def _age_quantiles_from_intervals(
+    counts,
+    age0,
+    n
+):
+    # Same values as open_df['Age'].quantile(i/n) without building open_df: a case contributes ages age0 .. age0+count-1
+    active = counts > 0
+    diff = np.zeros(int((age0[active] + counts[active]).max()) + 1, dtype=np.int64)
+    np.add.at(diff, age0[active], 1)
+    np.add.at(diff, age0[active] + counts[active], -1)
+    cumulative = np.cumsum(np.cumsum(diff))
+    total = cumulative[-1]
+    quantile_values = []
+    for i in range(n+1):
+        position = (i/n) * (total - 1)
+        lower = int(np.floor(position))
+        upper = min(lower + 1, total - 1)
+        lower_value = np.searchsorted(cumulative, lower, side='right')
+        upper_value = np.searchsorted(cumulative, upper, side='right')
+        quantile_values.append(int(lower_value + (upper_value - lower_value) * (position - lower)))
+    return quantile_values
+
+
+def _sweep_open_case_counts(
+    min_date,
+    n_days,
+    first,
+    last,
+    age0,
+    bins,
+    labels
+):
+    # Daily open counts per age group from start/end events, without expanding cases into days
+    unique_labels = list(dict.fromkeys(labels))
+    diff = np.zeros((len(unique_labels), n_days + 1), dtype=np.int64)
+    for b, label in enumerate(labels):
+        # Integer ages in (bins[b], bins[b+1]]
+        low_age = 0 if np.isinf(bins[b]) else int(bins[b]) + 1
+        start = first + np.maximum(low_age - age0, 0)
+        end = last if np.isinf(bins[b+1]) else np.minimum(last, first + int(bins[b+1]) - age0 + 1)
+        valid = end > start
+        row = unique_labels.index(label)
+        np.add.at(diff[row], start[valid], 1)
+        np.add.at(diff[row], end[valid], -1)
+    counts = np.cumsum(diff[:, :n_days], axis=1)
+    day_index, label_index = np.nonzero(counts.T)
+    return pd.DataFrame({
+        'Date': min_date + pd.to_timedelta(day_index, unit='D'),
+        'Age Group': np.array(unique_labels, dtype=object)[label_index],
+        'Count': counts[label_index, day_index]
+    })
 
 
 def generate_open_cases_df(
@@ -4445,28 +5537,34 @@ def generate_open_cases_df(
     idCol,
     timezone,
     quantile_values=None,
-    n=5
+    n=5,
+    aggregate=False
 ):
-    df = df[df[openDateCol] >= min_date].copy()
-    open_df = pd.DataFrame()
+    # aggregate=True returns daily open counts per age group (Date, Age Group, Count) instead of one row per open case and day
+    df = df[df[openDateCol] >= min_date].reset_index(drop=True)
     max_date = pd.to_datetime(datetime.now(timezone).date())
-    current_date = min_date
-    while current_date <= max_date:
-        active_df = df[
-            (df[openDateCol] <= current_date) &
-            ((df[closeDateCol] > current_date) | df[closeDateCol].isnull())
-        ].copy()
-        active_df = active_df[~active_df[idCol].duplicated()]
-        active_df['Age'] = (current_date - active_df[openDateCol]).dt.days
-        active_df['Date'] = current_date
-        open_df = pd.concat([open_df, active_df[
-            ['Date', 'Age', idCol]
-        ]], ignore_index=True)
-        current_date += pd.Timedelta(days=1)
+    first, last, age0, n_days = _open_case_intervals(df, min_date, max_date, openDateCol, closeDateCol)
+    if aggregate and not df[idCol].duplicated().any():
+        if not quantile_values:
+            quantile_values = _age_quantiles_from_intervals(last - first, age0, n)
+        log_message(quantile_values)
+        bins, labels = _age_group_bins(quantile_values)
+        open_counts = _sweep_open_case_counts(min_date, n_days, first, last, age0, bins, labels)
+        log_message(f'[INFO] Generated open cases counts dataframe successfully!')
+        return open_counts
+    open_df = _expand_open_cases(df, min_date, idCol, first, last, age0)
     if not quantile_values:
         quantile_values = [int(open_df['Age'].quantile(i/n)) for i in range(n+1)]
     log_message(quantile_values)
-    open_df['Age Group'] = open_df['Age'].apply(lambda x: group(x, quantile_values))
+    bins, labels = _age_group_bins(quantile_values)
+    open_df['Age Group'] = pd.cut(open_df['Age'], bins=bins, labels=labels, ordered=False).astype('str')
+    if aggregate:
+        open_counts = open_df.groupby(['Date', 'Age Group'], sort=False).size().reset_index(name='Count')
+        open_counts['Age Group'] = pd.Categorical(open_counts['Age Group'], categories=list(dict.fromkeys(labels)))
+        open_counts = open_counts.sort_values(['Date', 'Age Group'], ignore_index=True)
+        open_counts['Age Group'] = open_counts['Age Group'].astype('str')
+        log_message(f'[INFO] Generated open cases counts dataframe successfully!')
+        return open_counts
     log_message(f'[INFO] Generated open cases dataframe successfully!')
     return open_df
 
@@ -4571,6 +5669,7 @@ def impute_by_group(df, group_col, target_col, method='median', mask=None):
 
 
 def read_excel_from_googlesheets(apiKey, spreadsheetId, sheetName):
+    require_modules('build', 'HttpError')
     try:
         sheet = build('sheets', 'v4', developerKey=apiKey).spreadsheets()
         sheet_data = sheet.values().get(spreadsheetId=spreadsheetId, range=f"{sheetName}").execute()
@@ -4612,10 +5711,9 @@ def get_access_token(client_id, client_secret, username, password, token_url):
         "username": username,
         "password": password
     }
-    response = requests.post(token_url, headers=headers, data=payload)
+    response = get_http_session().post(token_url, headers=headers, data=payload)
     if response.ok:
-        access_token = response.json().get("access_token")
-        refresh_token = response.json().get("refresh_token")
+        access_token, refresh_token = _store_oauth_token(token_url, client_id, response.json())
         log_message('Access Token Retrieved!')
         return access_token, refresh_token
     else:
@@ -4635,30 +5733,57 @@ def refresh_access_token(client_id, client_secret, refresh_token, token_url):
         "grant_type": "refresh_token",
         "refresh_token": refresh_token,
     }
-    response = requests.post(token_url, headers=headers, data=payload)
+    response = get_http_session().post(token_url, headers=headers, data=payload)
     if response.ok:
-        access_token = response.json().get("access_token")
-        refresh_token = response.json().get("refresh_token")
-        return access_token, refresh_token
+        return _store_oauth_token(token_url, client_id, response.json())
     else:
         log_message(f'[ERROR] Failed to Retrieve Refreshed Access Token! Authorization Failed. Status Code: {response.status_code}')
         log_message(response.text)
         return None
 
 
-def get_resource(api_url, params=None):
+def _store_oauth_token(token_url, client_id, token_json):
+    access_token = token_json.get("access_token")
+    refresh_token = token_json.get("refresh_token")
+    _token_cache[('oauth', token_url, client_id)] = {
+        'access_token': access_token,
+        'refresh_token': refresh_token,
+        'expires_at': time.time() + float(token_json.get("expires_in") or 0)
+    }
+    return access_token, refresh_token
+
+
+def get_cached_access_token(client_id, client_secret, refresh_token, token_url, rejected_token=None):
+    # Refreshes once under a per-client lock when the cached token is missing, expiring or was rejected
+    key = ('oauth', token_url, client_id)
+    with _get_token_lock(key):
+        cached = _token_cache.get(key)
+        if cached and cached['access_token'] != rejected_token and _token_is_fresh(cached['expires_at']):
+            return cached['access_token'], cached['refresh_token']
+        if cached and cached.get('refresh_token'):
+            refresh_token = cached['refresh_token']
+        return refresh_access_token(client_id, client_secret, refresh_token, token_url)
+
+
+def _get_resource_response(api_url, params=None):
 
     global client_id, client_secret, access_token, refresh_token, token_url
-    access_token, refresh_token = refresh_access_token(client_id, client_secret, refresh_token, token_url)
+    access_token, refresh_token = get_cached_access_token(client_id, client_secret, refresh_token, token_url)
     headers = {
         "Authorization": f"Bearer {access_token}"
     }
 
-    if params:
-        response = requests.get(api_url, headers=headers, params=params)
-    else:
-        response = requests.get(api_url, headers=headers)
+    response = get_http_session().get(api_url, headers=headers, params=params or None)
+    if response.status_code == 401:
+        access_token, refresh_token = get_cached_access_token(client_id, client_secret, refresh_token, token_url, rejected_token=access_token)
+        headers["Authorization"] = f"Bearer {access_token}"
+        response = get_http_session().get(api_url, headers=headers, params=params or None)
+    return response
+
+
+def get_resource(api_url, params=None):
 
+    response = _get_resource_response(api_url, params)
     if response.status_code == 200:
         return response.json()
     else:
@@ -4667,43 +5792,123 @@ def get_resource(api_url, params=None):
         return response
 
 
-def get_full_resource(api_url):
+class _AdaptiveRateLimiter:
+    # Spaces requests across threads; slows down on throttling and recovers gradually on success
+    def __init__(self, requests_per_second=None, max_interval=60):
+        self.base_interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self.interval = self.base_interval
+        self.max_interval = max_interval
+        self._next_time = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_time)
+            self._next_time = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def throttled(self, wait):
+        with self._lock:
+            self.interval = min(max(self.interval * 2, 0.5), self.max_interval)
+            self._next_time = max(self._next_time, time.monotonic() + wait)
+
+    def succeeded(self):
+        with self._lock:
+            self.interval = max(self.base_interval, self.interval * 0.9)
+
+
+def get_full_resource(api_url, max_workers=1, requests_per_second=None, max_retries=6):
+    # requests_per_second defaults to one request per second per worker: serial paging keeps the original 1s spacing,
+    # max_workers > 1 scales it up, and the limiter still backs off on 429/503
+    limiter = _AdaptiveRateLimiter(requests_per_second or max_workers)
+
+    def fetch_page(url, params=None):
+        for attempt in range(max_retries):
+            limiter.acquire()
+            response = _get_resource_response(url, params)
+            if response.status_code in (429, 503):
+                retry_after = response.headers.get('Retry-After')
+                wait = float(retry_after) if retry_after and retry_after.isdigit() else min(2 ** attempt, 60) + random.random()
+                limiter.throttled(wait)
+                log_message(f'[WARNING] Throttled with HTTP {response.status_code}. Retrying in {wait:.1f}s ({attempt + 1}/{max_retries})...')
+                continue
+            if response.status_code != 200:
+                raise Exception(f'OData Error: {response.status_code}, {response.text}')
+            limiter.succeeded()
+            return response.json()
+        raise Exception(f'OData Error: still throttled after {max_retries} retries for {url}')
+
+    column_data = {}
+    row_count = 0
+
+    def add_page(page):
+        # Columns are built a page at a time; fields missing from a record (or a whole page) are padded with NaN
+        nonlocal row_count
+        records = page.get('value', [])
+        if not records:
+            return
+        page_columns = dict.fromkeys(col for record in records for col in record)
+        for col in page_columns:
+            if col not in column_data:
+                column_data[col] = [np.nan] * row_count
+            column_data[col].extend([record.get(col, np.nan) for record in records])
+        row_count += len(records)
+        for values in column_data.values():
+            if len(values) < row_count:
+                values.extend([np.nan] * (row_count - len(values)))
 
-    resources = []
     params = {
     "$count": "true"
     }
-    response = get_resource(api_url, params)
+    response = fetch_page(api_url, params)
     total_number = response.get('@odata.count', None)
     table_name = response.get('@odata.context', None).split('#')[-1]
+    add_page(response)
+    next_link = response.get('@odata.nextLink')
+    page_size = len(response.get('value', []))
+
     if total_number is not None:
-        total_pages = total_number// 50 + (total_number % 50 > 0)
+        total_pages = total_number// page_size + (total_number % page_size > 0) if page_size else 1
         with tqdm(total=total_pages, desc=f'Fetching "{table_name}"') as pbar:
-            while True:
-                response = get_resource(api_url)
-                resources.extend(response['value'])
-                pbar.update(1)
-                try:
-                    api_url = response['@odata.nextLink']
-                    time.sleep(1)
-                except:
-                    break
+            pbar.update(1)
+            if max_workers > 1 and next_link:
+                # The server page size is taken from the first response so $skip offsets line up with its pages
+                offsets = iter(range(page_size, total_number, page_size))
+                in_flight = deque()
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    for offset in offsets:
+                        in_flight.append(executor.submit(fetch_page, api_url, {'$skip': offset, '$top': page_size}))
+                        if len(in_flight) >= max_workers * 2:
+                            break
+                    while in_flight:
+                        add_page(in_flight.popleft().result())
+                        pbar.update(1)
+                        offset = next(offsets, None)
+                        if offset is not None:
+                            in_flight.append(executor.submit(fetch_page, api_url, {'$skip': offset, '$top': page_size}))
+                if row_count != total_number:
+                    log_message(f'[WARNING] Expected {total_number} records from "{table_name}" but fetched {row_count}; the source may have changed while paging.')
+            else:
+                while next_link:
+                    response = fetch_page(next_link)
+                    add_page(response)
+                    pbar.update(1)
+                    next_link = response.get('@odata.nextLink')
 
     else:
         page_index = 0
-        while True:
-            response = get_resource(api_url, params)
-            resources.extend(response['value'])
+        log_message(f'[INFO] Page {page_index} added!')
+        while next_link:
+            response = fetch_page(next_link)
+            add_page(response)
+            page_index += 1
             log_message(f'[INFO] Page {page_index} added!')
-            try:
-                api_url = response['@odata.nextLink']
-                page_index += 1
-                time.sleep(1)
-            except:
-                log_message(f'[INFO] All pages retrieved!')
-                break
+            next_link = response.get('@odata.nextLink')
+        log_message(f'[INFO] All pages retrieved!')
 
-    df = pd.DataFrame(resources)
+    df = pd.DataFrame(column_data)
     return df, table_name
 
 
@@ -4717,55 +5922,211 @@ def list_timestream_tables(timestream_write_client, database_name):
         return []
 
 
-def fetch_data_from_timestream(timestream_query_client, query): 
+def _timestream_scalar(value, scalar_type):
+    if value is None:
+        return None
+    if scalar_type in ('BIGINT', 'INTEGER'):
+        return int(value)
+    if scalar_type == 'DOUBLE':
+        return float(value)
+    if scalar_type == 'BOOLEAN':
+        return value == 'true'
+    if scalar_type == 'TIMESTAMP':
+        return pd.Timestamp(value)
+    return value
+
+
+def _timestream_datum(datum, column_type):
+    # Decodes nested TimeSeries/Array/Row values; top-level scalars are typed per column instead
+    if datum.get('NullValue'):
+        return None
+    if 'ScalarValue' in datum:
+        return _timestream_scalar(datum['ScalarValue'], column_type.get('ScalarType'))
+    if 'TimeSeriesValue' in datum:
+        value_type = column_type['TimeSeriesMeasureValueColumnInfo']['Type']
+        return [
+            {'time': _timestream_scalar(point['Time'], 'TIMESTAMP'), 'value': _timestream_datum(point['Value'], value_type)}
+            for point in datum['TimeSeriesValue']
+        ]
+    if 'ArrayValue' in datum:
+        value_type = column_type['ArrayColumnInfo']['Type']
+        return [_timestream_datum(value, value_type) for value in datum['ArrayValue']]
+    if 'RowValue' in datum:
+        fields = column_type['RowColumnInfo']
+        return {
+            field.get('Name', str(i)): _timestream_datum(value, field['Type'])
+            for i, (field, value) in enumerate(zip(fields, datum['RowValue']['Data']))
+        }
+    return None
+
+
+def _timestream_series(values, column_type):
+    scalar_type = column_type.get('ScalarType')
+    if scalar_type in ('BIGINT', 'INTEGER'):
+        return pd.Series(values, dtype='string').astype('Int64')
+    if scalar_type == 'DOUBLE':
+        return pd.Series(values, dtype=object).astype(float)
+    if scalar_type == 'BOOLEAN':
+        return pd.Series(values, dtype=object).map({'true': True, 'false': False}).astype('boolean')
+    if scalar_type == 'TIMESTAMP':
+        return pd.Series(pd.to_datetime(values, format='%Y-%m-%d %H:%M:%S.%f'))
+    if scalar_type == 'DATE':
+        return pd.Series(pd.to_datetime(values, format='%Y-%m-%d'))
+    return pd.Series(values, dtype=object)
+
+
+def _iter_timestream_frames(timestream_query_client, query, chunksize=None, typed=True):
     paginator = timestream_query_client.get_paginator('query')
-    count_query = f"SELECT count(*) FROM ({query})"
-    count_page_iterator = paginator.paginate(QueryString=count_query)
-    total_rows = 0
-    for count_page in count_page_iterator:
-        if count_page['Rows']:
-            total_rows = int(count_page['Rows'][0]['Data'][0]['ScalarValue'])
-    if total_rows == 0:
-        return pd.DataFrame()
-    all_rows = []
-    column_headers = []
-    page_iterator = paginator.paginate(QueryString=query)
-    first_page = True
-    with tqdm(total=total_rows, desc="Fetching Data", unit="row") as pbar:
-        for page in page_iterator:
-            if first_page:
-                column_headers = [col['Name'] for col in page['ColumnInfo']]
-                first_page = False
+    column_info = None
+    buffers = []
+    decoders = []
+
+    def build_frame(size):
+        data = {}
+        for info, values in zip(column_info, buffers):
+            values = values[:size]
+            data[info['Name']] = _timestream_series(values, info['Type']) if typed else values
+        return pd.DataFrame(data)
+
+    with tqdm(total=100, desc="Fetching Data", unit="%") as pbar:
+        rows_fetched = 0
+        for page in paginator.paginate(QueryString=query):
+            if column_info is None:
+                column_info = page['ColumnInfo']
+                buffers = [[] for _ in column_info]
+                for info in column_info:
+                    if 'ScalarType' in info['Type'] or not typed:
+                        decoders.append(lambda datum: datum.get('ScalarValue'))
+                    else:
+                        decoders.append(lambda datum, column_type=info['Type']: _timestream_datum(datum, column_type))
             for row in page['Rows']:
-                row_data = [value['ScalarValue'] if 'ScalarValue' in value else None for value in row['Data']]
-                all_rows.append(row_data)
-                pbar.update(1)
-    df = pd.DataFrame(all_rows, columns=column_headers)
-    return df
+                for buffer, decode, datum in zip(buffers, decoders, row['Data']):
+                    buffer.append(decode(datum))
+            rows_fetched += len(page['Rows'])
+            progress = page.get('QueryStatus', {}).get('ProgressPercentage')
+            if progress is not None:
+                pbar.n = round(progress, 1)
+            pbar.set_postfix(rows=rows_fetched)
+            pbar.refresh()
+            while chunksize and buffers and len(buffers[0]) >= chunksize:
+                yield build_frame(chunksize)
+                buffers = [values[chunksize:] for values in buffers]
+        pbar.n = 100
+        pbar.refresh()
+    if column_info is None:
+        return
+    if buffers[0] or not rows_fetched:
+        yield build_frame(len(buffers[0]))
 
 
-def upload_to_timestream(timestream_write_client, df, database_name, table_name):
-    try:
-        timestream_write_client.delete_table(DatabaseName=database_name, TableName=table_name)
-        timestream_write_client.create_table(DatabaseName=database_name, TableName=table_name)
-        log_message(f'[SUCCESS] Table "{table_name}" deleted & created!')
+def fetch_data_from_timestream(timestream_query_client, query, chunksize=None, typed=True):
+    # Single pass over the query; columns are typed from ColumnInfo unless typed=False (raw strings)
+    frames = _iter_timestream_frames(timestream_query_client, query, chunksize, typed)
+    if chunksize:
+        return frames
+    return next(frames, pd.DataFrame())
 
-    except Exception as e:
-        log_message(f'[ERROR] Error deleting or creating table: {e}')
-        raise
+
+def _is_transient_timestream_rejection(reason):
+    reason = (reason or '').lower()
+    return 'throttl' in reason or 'internal' in reason
+
+
+def _write_timestream_batch(timestream_write_client, database_name, table_name, records, common_attributes, max_retries=5):
+    # Returns the number of records written; permanently rejected records (duplicates, out-of-window times, ...) are
+    # logged once and dropped instead of being retried
+    pending = records
+    dropped = 0
+    for attempt in range(max_retries + 1):
+        try:
+            timestream_write_client.write_records(
+                DatabaseName=database_name,
+                TableName=table_name,
+                Records=pending,
+                CommonAttributes=common_attributes
+            )
+            return len(records) - dropped
+        except timestream_write_client.exceptions.RejectedRecordsException as e:
+            # Accepted records in the batch are already written; only transiently rejected ones are resent
+            rejected = e.response.get('RejectedRecords', [])
+            retryable = [r for r in rejected if _is_transient_timestream_rejection(r.get('Reason'))]
+            permanent = [r for r in rejected if not _is_transient_timestream_rejection(r.get('Reason'))]
+            if permanent:
+                dropped += len(permanent)
+                log_message(f'[ERROR] Timestream rejected {len(permanent)} record(s) permanently: {({r.get("Reason") for r in permanent})}')
+            if not retryable:
+                return len(records) - dropped
+            reasons = {r.get('Reason') for r in retryable}
+            if attempt == max_retries:
+                raise Exception(f'{len(retryable)} record(s) rejected after {max_retries} retries: {reasons}') from e
+            pending = [pending[r['RecordIndex']] for r in retryable]
+            log_message(f'[WARNING] Timestream rejected {len(retryable)} record(s): {reasons}. Retrying ({attempt + 1}/{max_retries})...')
+        except (timestream_write_client.exceptions.ThrottlingException, timestream_write_client.exceptions.InternalServerException) as e:
+            if attempt == max_retries:
+                raise
+            log_message(f'[WARNING] Timestream write throttled: {e}. Retrying ({attempt + 1}/{max_retries})...')
+        time.sleep(min(2 ** attempt, 30) + random.random())
+
+
+def upload_to_timestream(timestream_write_client, df, database_name, table_name, batch_size=100, max_workers=8, max_retries=5, recreate_table=True):
+    if recreate_table:
+        try:
+            timestream_write_client.delete_table(DatabaseName=database_name, TableName=table_name)
+            timestream_write_client.create_table(DatabaseName=database_name, TableName=table_name)
+            log_message(f'[SUCCESS] Table "{table_name}" deleted & created!')
+
+        except Exception as e:
+            log_message(f'[ERROR] Error deleting or creating table: {e}')
+            raise
     try:
-        for index, row in tqdm(df.iterrows(), total=df.shape[0], desc=f'Uploading "{table_name}" to TimeStream', unit="Record"):
-            timestamp = int(datetime.now().timestamp() * 1000)
-            record = {
-                'Dimensions': [{'Name': dim, 'Value': str(row[dim])} for dim in df.columns.to_list()],
+        columns = df.columns.to_list()
+        rows = df.astype(str).values.tolist()
+        # Each row keeps a distinct millisecond timestamp, as when records were written one at a time; they count back from
+        # now so none lands in the future, which Timestream rejects (1M rows span ~17 minutes, well inside the memory store)
+        start_time = int(datetime.now().timestamp() * 1000) - len(rows) + 1
+        batch_size = min(batch_size, 100)
+        batches = []
+        for offset in range(0, len(rows), batch_size):
+            batch_rows = rows[offset:offset + batch_size]
+            shared = [i for i, col in enumerate(columns) if len({row[i] for row in batch_rows}) == 1]
+            varying = [i for i in range(len(columns)) if i not in shared]
+            common_attributes = {
+                'Dimensions': [{'Name': columns[i], 'Value': batch_rows[0][i]} for i in shared],
                 'MeasureName': '_',
                 'MeasureValue': '_',
                 'MeasureValueType': 'VARCHAR',
-                'Time': str(timestamp)
+                'TimeUnit': 'MILLISECONDS'
             }
-
-            timestream_write_client.write_records(DatabaseName=database_name, TableName=table_name, Records=[record])
-        log_message(f'[SUCCESS] Table "{table_name}" Loaded to Timestream "{database_name}" database!')
+            records = [
+                {
+                    'Dimensions': [{'Name': columns[i], 'Value': row[i]} for i in varying],
+                    'Time': str(start_time + offset + j)
+                }
+                for j, row in enumerate(batch_rows)
+            ]
+            batches.append((records, common_attributes))
+
+        start = time.time()
+        with tqdm(total=len(rows), desc=f'Uploading "{table_name}" to TimeStream', unit="Record") as pbar:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(_write_timestream_batch, timestream_write_client, database_name, table_name, records, common_attributes, max_retries)
+                    for records, common_attributes in batches
+                ]
+                written = 0
+                try:
+                    for future in as_completed(futures):
+                        batch_written = future.result()
+                        written += batch_written
+                        pbar.update(batch_written)
+                except Exception:
+                    for future in futures:
+                        future.cancel()
+                    raise
+        elapsed = time.time() - start
+        if written < len(rows):
+            log_message(f'[WARNING] {len(rows) - written} of {len(rows)} record(s) were rejected by Timestream and not written.')
+        log_message(f'[SUCCESS] Table "{table_name}" Loaded to Timestream "{database_name}" database! ({len(rows)} records in {elapsed:.1f}s, {len(rows) / elapsed if elapsed else 0:.0f} records/s)')
     except Exception as e:
         log_message(f'[ERROR] Failed to load "{table_name}" to Timestream. Error: {str(e)}')
         raise
@@ -4779,7 +6140,8 @@ def load_permissions_data(
     unProcessedAccess, 
     requiredMeasureNames, 
     database_name = None, 
-    table_name = None
+    table_name = None,
+    sync_mode = 'full'
 ):
     query = """
             SELECT deviceId, measure_name, COUNT(*) AS "Number of observation"
@@ -4787,11 +6149,17 @@ def load_permissions_data(
             GROUP BY deviceId, measure_name
             """
     ts_df = fetch_data_from_timestream(timestream_query_client, query)
-    def has_required_measures(group):
-        return set(requiredMeasureNames).issubset(set(group['measure_name']))
-    qualified_devices = ts_df.groupby('deviceId').filter(has_required_measures)
-    qualified_devices = qualified_devices['deviceId'].unique()
-    all_devices = sorted(ts_df['deviceId'].unique())
+    required_measures = set(requiredMeasureNames)
+    devices = ts_df['deviceId'].drop_duplicates()
+    measures_found = (
+        ts_df.loc[ts_df['measure_name'].isin(required_measures), ['deviceId', 'measure_name']]
+        .drop_duplicates()
+        .groupby('deviceId')
+        .size()
+    )
+    qualified_mask = devices.map(measures_found).fillna(0) >= len(required_measures)
+    qualified_devices = devices[qualified_mask.to_numpy()].to_numpy()
+    all_devices = sorted(devices)
     authorized_devices_count = len(qualified_devices)
     all_devices_count = len(all_devices)
 
@@ -4805,24 +6173,58 @@ def load_permissions_data(
     {processed_users_list}
     ''')
 
-    default_permissions = []
-    for user in unProcessedAccess:
-        for device in all_devices:
-            default_permissions.append({'UserName': user, 'deviceId': device})
-    for user in processedAccess:
-        for device in qualified_devices:
-            default_permissions.append({'UserName': user, 'deviceId': device})
-    default_permissions_df = pd.DataFrame(default_permissions)
+    def cross_join(users, devices):
+        users = np.asarray(list(users), dtype=object)
+        devices = np.asarray(list(devices), dtype=object)
+        return pd.DataFrame({'UserName': np.repeat(users, len(devices)), 'deviceId': np.tile(devices, len(users))})
+
+    default_permissions_df = pd.concat([
+        cross_join(unProcessedAccess, all_devices),
+        cross_join(processedAccess, qualified_devices)
+    ], ignore_index=True)
     updated_permissions_dataset = pd.concat([permissions_dataset, default_permissions_df], ignore_index=True)
 
     if database_name and table_name:
-        upload_to_timestream(timestream_write_client, updated_permissions_dataset[['UserName', 'deviceId']], database_name, table_name)
+        permissions = updated_permissions_dataset[['UserName', 'deviceId']]
+        if sync_mode == 'incremental':
+            sync_permissions_to_timestream(timestream_query_client, timestream_write_client, permissions, database_name, table_name)
+        else:
+            upload_to_timestream(timestream_write_client, permissions, database_name, table_name)
     return qualified_devices
 
 
+def sync_permissions_to_timestream(timestream_query_client, timestream_write_client, permissions, database_name, table_name):
+    # Timestream cannot delete records, so revoked pairs still require a full rebuild of the table
+    desired = permissions.astype(str).drop_duplicates()
+    try:
+        existing = fetch_data_from_timestream(
+            timestream_query_client,
+            f'SELECT DISTINCT "UserName", "deviceId" FROM "{database_name}"."{table_name}"',
+            typed=False
+        )
+    except Exception as e:
+        log_message(f'[WARNING] Could not read existing permissions from "{table_name}" ({e}). Falling back to a full rewrite.')
+        upload_to_timestream(timestream_write_client, permissions, database_name, table_name)
+        return
+    if existing.empty:
+        existing = pd.DataFrame(columns=['UserName', 'deviceId'])
+    existing = existing[['UserName', 'deviceId']].astype(str)
+    diff = desired.merge(existing, on=['UserName', 'deviceId'], how='outer', indicator=True)
+    added = diff.loc[diff['_merge'] == 'left_only', ['UserName', 'deviceId']]
+    removed_count = int((diff['_merge'] == 'right_only').sum())
+    log_message(f'[INFO] Permissions diff for "{table_name}": {len(added)} added, {removed_count} removed, {len(desired) - len(added)} unchanged.')
+    if removed_count:
+        log_message(f'[INFO] {removed_count} permission(s) were revoked. Rewriting "{table_name}" in full.')
+        upload_to_timestream(timestream_write_client, permissions, database_name, table_name)
+    elif len(added):
+        upload_to_timestream(timestream_write_client, added, database_name, table_name, recreate_table=False)
+    else:
+        log_message(f'[SUCCESS] Permissions in "{table_name}" are already up to date!')
+
+
 def t2m_login(base_url, developer_id, account, username, password):
     try:
-        response = requests.get(f"{base_url}login?t2maccount={account}&t2musername={username}&t2mpassword={password}&t2mdeveloperid={developer_id}")
+        response = get_http_session().get(f"{base_url}login?t2maccount={account}&t2musername={username}&t2mpassword={password}&t2mdeveloperid={developer_id}")
         response_data = response.json()
         if response_data.get('success') == True:
             pass # log_message(f'[SUCCESS] Logged into Talk2M!')
@@ -4835,7 +6237,7 @@ def t2m_login(base_url, developer_id, account, username, password):
 
 def t2m_logout(base_url, session_id, developer_id):
     try:
-        response = requests.get(f"{base_url}logout?t2msession={session_id}&t2mdeveloperid={developer_id}")        
+        response = get_http_session().get(f"{base_url}logout?t2msession={session_id}&t2mdeveloperid={developer_id}")        
         response_data = response.json()
         if response_data.get('success') == True:
             pass # log_message(f'[SUCCESS] Logged out of Talk2M!')
@@ -4851,7 +6253,7 @@ def get_account_info(base_url, developer_id, session_id=None):
         if session_id is None:
             session_id = t2m_login(base_url, developer_id, account, username, password)
             temporary_session = True
-        response = requests.get(f"{base_url}getaccountinfo?t2msession={session_id}&t2mdeveloperid={developer_id}") 
+        response = get_http_session().get(f"{base_url}getaccountinfo?t2msession={session_id}&t2mdeveloperid={developer_id}") 
         if temporary_session:
             t2m_logout(base_url, session_id, developer_id)
         response_data = response.json()
@@ -4870,7 +6272,7 @@ def get_ewons(base_url, developer_id, session_id=None):
         if session_id is None:
             session_id = t2m_login(base_url, developer_id, account, username, password)
             temporary_session = True
-        response = requests.get(f"{base_url}getewons?t2msession={session_id}&t2mdeveloperid={developer_id}")
+        response = get_http_session().get(f"{base_url}getewons?t2msession={session_id}&t2mdeveloperid={developer_id}")
         if temporary_session:
             t2m_logout(base_url, session_id, developer_id)
         response_data = response.json()
@@ -4889,7 +6291,7 @@ def get_ewon(base_url, developer_id, ewon_id, session_id=None):
     if session_id is None:
         session_id = t2m_login(base_url, developer_id, account, username, password)
         temporary_session = True
-    response = requests.get(f"{base_url}getewon?id={ewon_id}&t2msession={session_id}&t2mdeveloperid={developer_id}")
+    response = get_http_session().get(f"{base_url}getewon?id={ewon_id}&t2msession={session_id}&t2mdeveloperid={developer_id}")
     if temporary_session:
         t2m_logout(base_url, session_id, developer_id)
     return response.json()
@@ -4902,7 +6304,7 @@ def get_ewon_details(base_url, developer_id, encodedName, device_username, devic
         if session_id is None:
             session_id = t2m_login(base_url, developer_id, account, username, password)
             temporary_session = True
-        response = requests.get(f"{base_url}get/{encodedName}/rcgi.bin/ParamForm?AST_Param=$dtES$ftH$fn&t2msession={session_id}&t2mdeveloperid={developer_id}&t2mdeviceusername={device_username}&t2mdevicepassword={device_password}")
+        response = get_http_session().get(f"{base_url}get/{encodedName}/rcgi.bin/ParamForm?AST_Param=$dtES$ftH$fn&t2msession={session_id}&t2mdeveloperid={developer_id}&t2mdeviceusername={device_username}&t2mdevicepassword={device_password}")
         if temporary_session:
             t2m_logout(base_url, session_id, developer_id)
         if response.status_code == 200:
@@ -5211,7 +6613,7 @@ def stop_driver(ip_address, username, password):
     url = f"http://{ip_address}//rcgi.bin/jvmCmd?cmd=stop"  
 
     try:
-        response = requests.get(url, auth=HTTPBasicAuth(username, password))
+        response = get_http_session().get(url, auth=HTTPBasicAuth(username, password))
         log_message()
         log_message()
 
@@ -5597,14 +6999,14 @@ def classify_items_rrs(
 
 
 def read_excel_from_sharepoint(url):
-    response = requests.get(url)
+    response = get_http_session().get(url)
     if response.status_code == 200:
         match = re.search(r'var _wopiContextJson\s*=\s*(\{.*?\});', response.text, re.DOTALL)
         if match:
             wopi_context = json.loads(match.group(1))
             file_get_url = wopi_context.get("FileGetUrl")
             if file_get_url:
-                file_response = requests.get(file_get_url, stream=True)
+                file_response = get_http_session().get(file_get_url, stream=True)
                 file_size = int(file_response.headers.get('content-length', 0))
                 progress = tqdm(total=file_size, unit='B', unit_scale=True, desc='Downloading Excel file')
                 xlsx_data = io.BytesIO()
@@ -5645,6 +7047,138 @@ def generate_table_select_queries(
     return table_queries
 
 
+class _S3StreamReader(io.RawIOBase):
+    # Raw file object over a botocore StreamingBody so readers pull bytes straight off the socket
+    def __init__(self, body, progress=None, object_key=None):
+        self._body = body
+        self._progress = progress
+        self._object_key = object_key
+        self._bytes_read = 0
+        self._started = time.perf_counter()
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self._body.read(len(buffer))
+        size = len(data)
+        buffer[:size] = data
+        self._bytes_read += size
+        if self._progress is not None:
+            self._progress.update(size)
+        return size
+
+    def close(self):
+        if not self.closed:
+            if self._progress is not None:
+                self._progress.close()
+            self._body.close()
+            if self._object_key is not None:
+                elapsed = time.perf_counter() - self._started
+                log_message(f'[INFO] Downloaded "{self._object_key}" ({self._bytes_read / 1024 / 1024:.1f} MB) in {elapsed:.2f}s at {self._bytes_read / 1024 / 1024 / max(elapsed, 1e-9):.1f} MB/s using 1 stream.')
+        super().close()
+
+
+def open_s3_stream(
+    bucket_name,
+    object_key,
+    s3_client,
+    buffer_size=1024 * 1024
+):
+    obj = s3_client.get_object(Bucket=bucket_name, Key=object_key)
+    file_size = obj['ContentLength']
+    progress = tqdm(total=file_size, unit='B', unit_scale=True, desc=f'Downloading {object_key}')
+    return io.BufferedReader(_S3StreamReader(obj['Body'], progress, object_key), buffer_size=buffer_size), file_size
+
+
+def read_s3_object_bytes(
+    bucket_name,
+    object_key,
+    s3_client
+):
+    stream, file_size = open_s3_stream(bucket_name, object_key, s3_client)
+    buffer = bytearray(file_size)
+    view = memoryview(buffer)
+    offset = 0
+    with stream:
+        while offset < file_size:
+            size = stream.readinto(view[offset:])
+            if not size:
+                break
+            offset += size
+    return view[:offset]
+
+
+def download_s3_object_parallel(
+    bucket_name,
+    object_key,
+    s3_client,
+    part_size=8 * 1024 * 1024,
+    max_concurrency=8,
+    use_temp_file=False,
+    temp_dir=None
+):
+    # Returns a memoryview over a preallocated buffer, or the path of a memory-mapped temp file when use_temp_file=True
+    file_size = s3_client.head_object(Bucket=bucket_name, Key=object_key)['ContentLength']
+    ranges = [(start, min(start + part_size, file_size) - 1) for start in range(0, file_size, part_size)]
+    temp_path = None
+    if use_temp_file:
+        fd, temp_path = tempfile.mkstemp(suffix=os.path.splitext(object_key)[1], dir=temp_dir)
+        os.close(fd)
+        with open(temp_path, 'r+b') as f:
+            f.truncate(file_size)
+        if file_size == 0:
+            return temp_path
+        temp_file = open(temp_path, 'r+b')
+        buffer = mmap.mmap(temp_file.fileno(), file_size)
+    else:
+        buffer = bytearray(file_size)
+    view = memoryview(buffer)
+    progress = tqdm(total=file_size, unit='B', unit_scale=True, desc=f'Downloading {object_key} ({max_concurrency} streams)')
+    progress_lock = threading.Lock()
+
+    def download_range(start, end):
+        body = s3_client.get_object(Bucket=bucket_name, Key=object_key, Range=f'bytes={start}-{end}')['Body']
+        offset = start
+        try:
+            while offset <= end:
+                chunk = body.read(min(1024 * 1024, end + 1 - offset))
+                if not chunk:
+                    break
+                view[offset:offset + len(chunk)] = chunk
+                offset += len(chunk)
+                with progress_lock:
+                    progress.update(len(chunk))
+        finally:
+            body.close()
+        if offset != end + 1:
+            raise IOError(f'Incomplete range bytes={start}-{end} for "{object_key}": got {offset - start} bytes.')
+
+    started = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            for future in as_completed([executor.submit(download_range, start, end) for start, end in ranges]):
+                future.result()
+    except Exception:
+        if use_temp_file:
+            view.release()
+            buffer.close()
+            temp_file.close()
+            os.remove(temp_path)
+        raise
+    finally:
+        progress.close()
+    elapsed = time.perf_counter() - started
+    log_message(f'[INFO] Downloaded "{object_key}" ({file_size / 1024 / 1024:.1f} MB) in {elapsed:.2f}s at {file_size / 1024 / 1024 / max(elapsed, 1e-9):.1f} MB/s using {len(ranges)} parts on {max_concurrency} streams.')
+    if use_temp_file:
+        view.release()
+        buffer.flush()
+        buffer.close()
+        temp_file.close()
+        return temp_path
+    return view
+
+
 def read_file_from_s3(
     bucket_name, 
     object_key, 
@@ -5652,97 +7186,132 @@ def read_file_from_s3(
     encoding='utf-8', 
     file_type = 'csv',
     low_memory = True, 
-    dtype_str=False
+    dtype_str=False,
+    chunksize=None,
+    parallel_download=False,
+    part_size=8 * 1024 * 1024,
+    max_concurrency=8,
+    use_temp_file=False
 ):
-
-    def stream_with_progress():
-        obj = s3_client.get_object(Bucket=bucket_name, Key=object_key)
-        file_size = obj['ContentLength']
-        progress = tqdm(total=file_size, unit='B', unit_scale=True, desc=f'Downloading {object_key}')
-        body = obj['Body']
+    # With chunksize set, an iterator of DataFrames is returned and peak memory is bounded by the chunk size
+    # parallel_download fetches the object with concurrent ranged GETs into a buffer (or a temp file with use_temp_file=True)
+    if file_type not in ('csv', 'parquet', 'xlsx'):
+        raise ValueError(f"Unsupported file_type: {file_type}. Use 'csv', 'parquet', or 'xlsx'.")
+    if file_type == 'xlsx' and chunksize:
+        raise ValueError("chunksize is not supported for file_type 'xlsx'.")
+    temp_path = None
+    data = None
+    if parallel_download:
+        data = download_s3_object_parallel(bucket_name, object_key, s3_client, part_size=part_size, max_concurrency=max_concurrency, use_temp_file=use_temp_file)
+        if use_temp_file:
+            temp_path, data = data, None
+
+    handed_off = False
+
+    def remove_temp_file(path):
+        if path is not None and os.path.exists(path):
+            os.remove(path)
+
+    def iter_and_cleanup(chunks, path, *resources):
         try:
-            while True:
-                chunk = body.read(1024 * 1024)
-                if not chunk:
-                    break
-                progress.update(len(chunk))
+            for chunk in chunks:
                 yield chunk
         finally:
-            progress.close()
-    stream = stream_with_progress()
-    if file_type == 'csv':
-        csv_bytes = io.BytesIO(b''.join(stream))
-        csv_buffer = io.TextIOWrapper(csv_bytes, encoding=encoding)
-        csv_buffer.seek(0)
-        try:
+            for resource in resources:
+                resource.close()
+            remove_temp_file(path)
+
+    try:
+        if file_type == 'csv':
+            if temp_path is not None:
+                stream = open(temp_path, 'rb')
+            elif data is not None:
+                stream = io.BufferedReader(_S3StreamReader(pa.BufferReader(data)), buffer_size=1024 * 1024)
+            else:
+                stream, file_size = open_s3_stream(bucket_name, object_key, s3_client)
+            read_kwargs = dict(sep=',', quotechar='"', quoting=csv.QUOTE_ALL, encoding=encoding, low_memory=low_memory, chunksize=chunksize)
             if dtype_str:
-                df = pd.read_csv(csv_buffer, sep=',', quotechar='"', quoting=csv.QUOTE_ALL, low_memory=low_memory, dtype=str, na_values=[''], keep_default_na=False)
-            else:    
-                df = pd.read_csv(csv_buffer, sep=',', quotechar='"', quoting=csv.QUOTE_ALL, low_memory=low_memory)        
-        except:
-            log_message(f'[WARNING] S3 file "{object_key}" is empty. Returning empty DataFrame.')
-            return pd.DataFrame()
-    elif file_type == 'parquet':
-        parquet_buffer = io.BytesIO(b''.join(stream))
-        if parquet_buffer.getbuffer().nbytes == 0:
+                read_kwargs.update(dtype=str, na_values=[''], keep_default_na=False)
+            try:
+                reader = pd.read_csv(stream, **read_kwargs)
+            except:
+                stream.close()
+                log_message(f'[WARNING] S3 file "{object_key}" is empty. Returning empty DataFrame.')
+                return iter([]) if chunksize else pd.DataFrame()
+            if chunksize:
+                handed_off = True
+                return iter_and_cleanup(reader, temp_path, reader, stream)
+            stream.close()
+            return reader
+        if temp_path is None and data is None:
+            data = read_s3_object_bytes(bucket_name, object_key, s3_client)
+        size = os.path.getsize(temp_path) if temp_path is not None else data.nbytes
+        if size == 0:
             log_message(f'[WARNING] S3 file "{object_key}" is empty. Returning empty DataFrame.')
-            return pd.DataFrame()
-        df = pd.read_parquet(parquet_buffer)
+            return iter([]) if chunksize else pd.DataFrame()
+        if file_type == 'xlsx':
+            return pd.read_excel(temp_path if temp_path is not None else io.BytesIO(data), engine='openpyxl')
+        if temp_path is not None:
+            parquet_file = pq.ParquetFile(temp_path, memory_map=True)
+        else:
+            parquet_file = pq.ParquetFile(pa.BufferReader(data))
+        if chunksize:
+            batches = (batch.to_pandas() for batch in parquet_file.iter_batches(batch_size=chunksize))
+            handed_off = True
+            return iter_and_cleanup((df.astype(str) if dtype_str else df for df in batches), temp_path, parquet_file)
+        df = parquet_file.read().to_pandas()
+        parquet_file.close()
         if dtype_str:
             df = df.astype(str)
-    elif file_type == 'xlsx':
-        xlsx_buffer = io.BytesIO(b''.join(stream))
-        if xlsx_buffer.getbuffer().nbytes == 0:
-            log_message(f'[WARNING] S3 file "{object_key}" is empty. Returning empty DataFrame.')
-            return pd.DataFrame()
-        df = pd.read_excel(xlsx_buffer, engine='openpyxl')
-    else:
-        raise ValueError(f"Unsupported file_type: {file_type}. Use 'csv', 'parquet', or 'xlsx'.")
-    return df
+        return df
+    finally:
+        if not handed_off:
+            remove_temp_file(temp_path)
 
 
 def read_iif_from_s3(
     bucket_name, 
     object_key, 
     s3_client, 
-    encoding='Windows-1252'
+    encoding='Windows-1252',
+    chunksize=None
 ):
 
-    iif_obj = s3_client.get_object(Bucket=bucket_name, Key=object_key)
-    file_size = iif_obj['ContentLength']   
-    progress = tqdm(total=file_size, unit='B', unit_scale=True, desc=f'Downloading {object_key}')
-
-    def stream_with_progress(bytes_io):
-        while True:
-            chunk = bytes_io.read(1024 * 1024)
-            if not chunk:
-                break
-            progress.update(len(chunk))
-            yield chunk
-        progress.close()
-
-    body = iif_obj['Body']
-    stream = stream_with_progress(body)
-    iif_string = b''.join(stream).decode(encoding)  
-    iif_buffer = io.StringIO(iif_string)
+    stream, file_size = open_s3_stream(bucket_name, object_key, s3_client)
     columns = [f'Column{i}' for i in range(1, 101)]
-    df = pd.read_csv(iif_buffer, delimiter='\t', names=columns, encoding=encoding)
-
-    return df
+    reader = pd.read_csv(stream, delimiter='\t', names=columns, encoding=encoding, chunksize=chunksize)
+    if chunksize:
+        def iter_chunks():
+            with stream, reader:
+                for chunk in reader:
+                    yield chunk
+        return iter_chunks()
+    stream.close()
+    return reader
 
 
 def safe_read_file_from_s3(
         bucket_name, 
         object_key, 
         s3_client,
-        expected_columns
+        expected_columns,
+        encoding='utf-8',
+        file_type='csv',
+        dtype_str=False,
+        prefetcher=None
     ):
         try:
-            df = read_file_from_s3(
-                s3_client=s3_client,
-                bucket_name=bucket_name,
-                object_key=object_key
-            )
+            if prefetcher is not None:
+                df = prefetcher.get(object_key, bucket_name, encoding, file_type, dtype_str)
+            else:
+                df = read_file_from_s3(
+                    s3_client=s3_client,
+                    bucket_name=bucket_name,
+                    object_key=object_key,
+                    encoding=encoding,
+                    file_type=file_type,
+                    dtype_str=dtype_str
+                )
         except Exception as e:
             log_message(f"[WARNING] Failed reading {object_key} from {bucket_name}: {e}. Returning fallback schema.")
             df = pd.DataFrame(columns=expected_columns)
@@ -5756,6 +7325,92 @@ def safe_read_file_from_s3(
         return df
 
 
+class _S3Prefetcher:
+    # Downloads and parses declared objects on a thread pool; at most max_ready frames are held until consumed
+    def __init__(self, s3_client, bucket_name, object_keys, max_workers=4, max_ready=6, encoding='utf-8', file_type='csv', dtype_str=False):
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.encoding = encoding
+        self.file_type = file_type
+        self.dtype_str = dtype_str
+        self._entries = {
+            object_key: {'state': 'pending', 'event': threading.Event(), 'df': None, 'error': None}
+            for object_key in dict.fromkeys(object_keys)
+        }
+        self._lock = threading.Lock()
+        self._slots = threading.Semaphore(max_ready)
+        self._closed = False
+        self._hits = 0
+        self._misses = 0
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        for object_key in self._entries:
+            self._executor.submit(self._prefetch, object_key)
+
+    def _read(self, object_key, bucket_name=None, encoding=None, file_type=None, dtype_str=None):
+        return read_file_from_s3(
+            s3_client=self.s3_client,
+            bucket_name=bucket_name or self.bucket_name,
+            object_key=object_key,
+            encoding=encoding or self.encoding,
+            file_type=file_type or self.file_type,
+            dtype_str=self.dtype_str if dtype_str is None else dtype_str
+        )
+
+    def _prefetch(self, object_key):
+        while not self._slots.acquire(timeout=0.5):
+            if self._closed:
+                return
+        with self._lock:
+            entry = self._entries.get(object_key)
+            if self._closed or entry is None or entry['state'] != 'pending':
+                self._slots.release()
+                return
+            entry['state'] = 'loading'
+        try:
+            entry['df'] = self._read(object_key)
+        except Exception as e:
+            entry['error'] = e
+        finally:
+            entry['event'].set()
+
+    def get(self, object_key, bucket_name=None, encoding='utf-8', file_type='csv', dtype_str=False):
+        # The caller's read options (defaults match read_file_from_s3) must match the prefetcher's; otherwise the object is
+        # read inline with the caller's options. Objects that were not declared, or not started yet, are also read inline
+        bucket_name = bucket_name or self.bucket_name
+        if (bucket_name, encoding, file_type, dtype_str) != (self.bucket_name, self.encoding, self.file_type, self.dtype_str):
+            self._misses += 1
+            return self._read(object_key, bucket_name, encoding, file_type, dtype_str)
+        with self._lock:
+            entry = self._entries.pop(object_key, None)
+            if entry is not None and entry['state'] == 'pending':
+                entry['state'] = 'consumed'
+                entry = None
+        if entry is None:
+            self._misses += 1
+            return self._read(object_key)
+        self._hits += 1
+        entry['event'].wait()
+        self._slots.release()
+        if entry['error'] is not None:
+            raise entry['error']
+        return entry['df']
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            unused = list(self._entries)
+            self._entries.clear()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        log_message(f'[INFO] Prefetcher served {self._hits} object(s) from the background pool and read {self._misses} inline.{f" Unused: {unused}." if unused else ""}')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
 def group(
     x, 
     quantile_values
@@ -5784,6 +7439,28 @@ def find_unique_value_columns(
     return unique_value_columns
     
 
+def apply_rules(
+    df,
+    rules,
+    default=None
+):
+    # rules is an ordered list of (value, predicate) pairs; each predicate takes the whole frame and returns a boolean
+    # column (or a scalar for catch-all rules). As in an if/elif chain, the first rule that holds for a row gives its value.
+    # Values can be scalars or columns, and rows matching no rule get the default.
+    conditions = []
+    choices = []
+    for value, predicate in rules:
+        condition = predicate(df)
+        if np.ndim(condition) == 0:
+            condition = pd.Series(bool(condition), index=df.index)
+        condition = pd.Series(condition, index=df.index).fillna(False).to_numpy(dtype=bool)
+        conditions.append(condition)
+        choices.append(value.to_numpy() if isinstance(value, pd.Series) else value)
+    if not conditions:
+        return pd.Series(default, index=df.index)
+    return pd.Series(np.select(conditions, choices, default=default), index=df.index)
+
+
 def correctCompleteDates(
     df, 
     orderStatusCol, 
@@ -5802,28 +7479,16 @@ def correctCompleteDates(
         df[col] = df[col].mask(df[col] > today, today)
 
     postCompletionStatuses = set(postCompletionStatuses)
-    def correctCompleteDate(row):
-        orderStatus = row[orderStatusCol]
-        orderDate = row[orderDateCol]
-        completeDate = row[completeDateCol]
-        arriveDate = row[shipDateCol]
-        invoiceDate = row[invoiceDateCol]
-        lastModDate = row[lastModDateCol]
-        if completeDate >= orderDate:
-            return completeDate
-
-        if orderStatus in postCompletionStatuses:
-            if arriveDate >= orderDate:
-                return arriveDate
-            if invoiceDate >= orderDate:
-                return invoiceDate
-            if lastModDate >= orderDate:
-                return lastModDate
-            if fallback_to_order_date:
-                return orderDate
-        else:
-            return None
-    df['CorrectedCompletedDate'] = df.apply(correctCompleteDate, axis=1)
+    orderDate = df[orderDateCol]
+    postCompletion = lambda d: d[orderStatusCol].isin(postCompletionStatuses)
+    rules = [
+        (df[completeDateCol], lambda d: d[completeDateCol] >= orderDate),
+        (df[shipDateCol], lambda d: postCompletion(d) & (d[shipDateCol] >= orderDate)),
+        (df[invoiceDateCol], lambda d: postCompletion(d) & (d[invoiceDateCol] >= orderDate)),
+        (df[lastModDateCol], lambda d: postCompletion(d) & (d[lastModDateCol] >= orderDate)),
+        (orderDate, lambda d: postCompletion(d) & fallback_to_order_date),
+    ]
+    df['CorrectedCompletedDate'] = apply_rules(df, rules, default=np.datetime64('NaT'))
     return df
 
 
@@ -5844,6 +7509,139 @@ def find_useful_columns(
     return useful_cols
 
 
+_VALID_STATES = {**valid_us_states, **valid_ca_states}
+_VALID_STATE_ABBREVIATIONS = set(_VALID_STATES.values())
+_US_ZIP_PATTERN = re.compile(r"\d{5}(\d{4})?")
+_CA_ZIP_PATTERN = re.compile(r"[A-Za-z]\d[A-Za-z](\d[A-Za-z]\d)?")
+
+
+def _map_distinct(values, func):
+    # Applies func once per distinct value (nulls included) and broadcasts the results back
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    mapped = np.empty(len(uniques), dtype=object)
+    for i, value in enumerate(uniques):
+        mapped[i] = func(value)
+    return pd.Series(mapped[codes], index=values.index, name=values.name)
+
+
+def _format_zip_code(x):
+    # Keeps the established output: US codes become x[0:5] + '-' + x[0:4], Canadian ones x[0:3] + ' ' + x[3:6]
+    if not isinstance(x, str):
+        return x
+    if _US_ZIP_PATTERN.fullmatch(x):
+        return x[0:5] + '-' + x[0:4]
+    if _CA_ZIP_PATTERN.fullmatch(x):
+        return x[0:3] + ' ' + x[3:6]
+    return x
+
+
+def _split_invalid_rows(df, columns, normalize, is_valid, finalize=None):
+    # Columns are checked in order and a row is reported under the first column it fails, with earlier columns
+    # already finalized and later ones untouched; masks are combined so the frame is only sliced once at the end
+    valid = np.ones(len(df), dtype=bool)
+    normalized = {}
+    finalized = {}
+    failures = []
+    for col in columns:
+        normalized[col] = normalize(df[col])
+        col_valid = is_valid(normalized[col]).fillna(False).to_numpy(dtype=bool)
+        failed = valid & ~col_valid
+        if failed.any():
+            failures.append((col, failed))
+        valid &= col_valid
+        finalized[col] = finalize(normalized[col]) if finalize else normalized[col]
+    invalid_parts = []
+    for col, failed in failures:
+        part = df.loc[failed].copy()
+        for earlier_col in columns[:columns.index(col)]:
+            part[earlier_col] = finalized[earlier_col][failed]
+        part[col] = normalized[col][failed]
+        invalid_parts.append(part)
+    invalid = pd.concat(invalid_parts, ignore_index=True) if invalid_parts else df.iloc[0:0].reset_index(drop=True)
+    df = df.loc[valid].copy()
+    for col in columns:
+        df[col] = finalized[col][valid]
+    return df, invalid
+
+
+# Month-first formats only, matching pd.to_datetime's default of dayfirst=False
+_DATE_FORMAT_CANDIDATES = [
+    '%Y-%m-%d',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d %H:%M:%S.%f',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S%z',
+    '%Y-%m-%dT%H:%M:%S.%f%z',
+    '%m/%d/%Y',
+    '%m/%d/%Y %H:%M',
+    '%m/%d/%Y %H:%M:%S',
+    '%m/%d/%Y %I:%M %p',
+    '%m/%d/%Y %I:%M:%S %p',
+    '%m-%d-%Y',
+    '%Y/%m/%d',
+    '%Y%m%d',
+]
+_date_format_cache = {}
+
+
+def _fix_two_digit_years(values):
+    # "1/5/0023" -> "1/5/2023": a trailing 4-digit year not starting with 19/20 is moved into the 2000s
+    year = values.str[-4:]
+    needs_fix = values.str.contains(r'/\d{4}$', regex=True) & ~year.str.startswith(('19', '20'))
+    return values.where(~needs_fix, values.str[:-4] + '20' + year.str[2:])
+
+
+def _infer_date_format(values, sample_size=200):
+    sample = pd.Series(values[values.ne('')].unique()[:sample_size])
+    if sample.empty:
+        return None
+    candidates = []
+    guess_format = getattr(getattr(pd.tseries, 'api', None), 'guess_datetime_format', None)
+    if guess_format is not None:
+        guessed = Counter(guess_format(value) for value in sample.head(20))
+        candidates += [fmt for fmt, _ in guessed.most_common() if fmt and '%d/%m' not in fmt and '%d-%m' not in fmt]
+    candidates += [fmt for fmt in _DATE_FORMAT_CANDIDATES if fmt not in candidates]
+    best_format, best_rate = None, 0.0
+    for fmt in candidates:
+        rate = pd.to_datetime(sample, format=fmt, errors='coerce').notna().mean()
+        if rate > best_rate:
+            best_format, best_rate = fmt, rate
+        if rate == 1.0:
+            break
+    return best_format
+
+
+def _parse_date_column(values, fmt):
+    # Dates repeat heavily, so each distinct string is parsed once and the result broadcast back by code
+    codes, uniques = pd.factorize(values)
+    uniques = pd.Series(uniques, dtype=object)
+    parsed = pd.to_datetime(uniques, format=fmt, errors='coerce')
+    # Values in another format fall back to element-wise parsing instead of being lost
+    leftover = parsed.isna() & uniques.ne('')
+    if leftover.any():
+        try:
+            fallback = pd.to_datetime(uniques[leftover], errors='coerce', format='mixed')
+        except (TypeError, ValueError):
+            fallback = pd.to_datetime(uniques[leftover], errors='coerce')
+        if fallback.notna().any() and fallback.dtype == parsed.dtype:
+            parsed = parsed.where(~leftover, fallback)
+    return pd.Series(parsed.array.take(codes), index=values.index, name=values.name)
+
+
+def _load_date_format_cache(cache_file):
+    if cache_file and os.path.exists(cache_file):
+        try:
+            with open(cache_file, 'r') as file:
+                _date_format_cache.update({tuple(key.split('|', 1)): fmt for key, fmt in json.load(file).items()})
+        except Exception as e:
+            log_message(f'[WARNING] Could not read date format cache "{cache_file}": {e}')
+
+
+def _save_date_format_cache(cache_file):
+    if cache_file:
+        write_json_atomic(cache_file, {f'{table}|{col}': fmt for (table, col), fmt in _date_format_cache.items()})
+
+
 def clean_df(
     s3_client,
     s3_bucket_name,
@@ -5858,24 +7656,39 @@ def clean_df(
     just_useful_columns=False,
     upload_enabled=False,
     convert_to_upper=True,
-    remove_extra_spaces=True
+    remove_extra_spaces=True,
+    date_format_cache_file=None
 ):
+    # Date formats are inferred once per (df_name, column) and reused; date_format_cache_file persists them across runs
     date_cols = [col for col in df.columns if 'date' in col.lower()] + additional_date_columns
     date_cols = list(set(date_cols))
+    _load_date_format_cache(date_format_cache_file)
+    cache_changed = False
     for col in date_cols:
+        start = time.perf_counter()
         initial_nulls = df[col].isna().sum()
+        fmt = None
         if df[col].dtype == 'object':
-            df[col] = df[col].fillna('').astype('str').str.replace(
-                r'(?<=/)(\d{4})$',
-                lambda x: x.group(1) if x.group(1).startswith(('19', '20'))
-                else '20' + x.group(1)[2:],
-                regex=True
-            )
-        df[col] = pd.to_datetime(df[col], errors='coerce')
+            values = _fix_two_digit_years(df[col].fillna('').astype('str'))
+            fmt = _date_format_cache.get((df_name, col))
+            if fmt is None or pd.to_datetime(values[values.ne('')].head(50), format=fmt, errors='coerce').isna().all():
+                fmt = _infer_date_format(values)
+                if fmt is not None and _date_format_cache.get((df_name, col)) != fmt:
+                    _date_format_cache[(df_name, col)] = fmt
+                    cache_changed = True
+            if fmt is not None:
+                df[col] = _parse_date_column(values, fmt)
+            else:
+                df[col] = pd.to_datetime(values, errors='coerce')
+        else:
+            df[col] = pd.to_datetime(df[col], errors='coerce')
         final_nulls = df[col].isna().sum()
         coerced_count = final_nulls - initial_nulls
         if coerced_count > 0:
             log_message(f"[WARNING] {col}: Coerced {coerced_count} invalid dates to NaT.")
+        log_message(f'[INFO] {col}: Parsed dates{f" with format {fmt!r}" if fmt else ""} in {time.perf_counter() - start:.3f}s.')
+    if cache_changed:
+        _save_date_format_cache(date_format_cache_file)
     if convert_to_upper or remove_extra_spaces:
         object_cols = [col for col in df.columns if df[col].dtype == 'object']
         for col in set(object_cols)-set(id_column):
@@ -5904,18 +7717,13 @@ def clean_df(
             # upload_to_s3(s3_client = s3_client,  data = duplicated_id, bucket_name = s3_bucket_name + '-c', object_key = f"{df_name}_duplicated_{id_column}.csv", CreateS3Bucket=True)
             upload_to_s3(s3_client = s3_client,  data = duplicated_id, bucket_name = s3_bucket_name + '-c', object_key = f"{df_name}_duplicated_{re.sub(r'[^a-zA-Z0-9]', '_', '_'.join(id_column))}.csv", CreateS3Bucket=True)
     if zip_code_columns:
-        invalid_zip_codes = pd.DataFrame()
-        valid_us_zip_regex = r"^\d{5}(\d{4})?$"
-        valid_ca_zip_regex = r"^[A-Za-z]\d[A-Za-z](\d[A-Za-z]\d)?$"
-        for col in zip_code_columns:
-            df[col] = df[col].astype('str').str.replace(' ','').str.replace('-','')
-            invalid_mask = ~(df[col].str.match(valid_us_zip_regex) | df[col].str.match(valid_ca_zip_regex))
-            invalid_zip_codes = pd.concat([invalid_zip_codes, df[invalid_mask]], ignore_index=True)
-            df = df[~invalid_mask].copy()
-            df[col] = df[col].apply(lambda x: \
-                                    x[0:5]+'-'+x[0:4] if isinstance(x, str) and re.match(valid_us_zip_regex, x) else \
-                                    x[0:3]+' '+x[3:6] if isinstance(x, str) and re.match(valid_ca_zip_regex, x) else \
-                                    x)
+        df, invalid_zip_codes = _split_invalid_rows(
+            df,
+            zip_code_columns,
+            normalize=lambda values: values.astype('str').str.replace(' ', '').str.replace('-', ''),
+            is_valid=lambda values: values.str.fullmatch(_US_ZIP_PATTERN) | values.str.fullmatch(_CA_ZIP_PATTERN),
+            finalize=lambda values: _map_distinct(values, _format_zip_code).astype(values.dtype)
+        )
         log_message(f'[INFO] invalid_zip_codes found: {len(invalid_zip_codes)}')
         if len(invalid_zip_codes)>0 and upload_enabled:
             upload_to_s3(s3_client = s3_client, data = invalid_zip_codes, bucket_name = s3_bucket_name + '-c', object_key = f"{df_name}_invalid_zip_codes.csv", CreateS3Bucket=True)
@@ -5924,12 +7732,12 @@ def clean_df(
                 invalid_zip_codes[col] = np.nan
             df = pd.concat([df, invalid_zip_codes], ignore_index=True)
     if state_columns:
-        invalid_states = pd.DataFrame()
-        for col in state_columns:
-            df[col] = df[col].apply(extract_state).fillna('').astype('str')
-            invalid_mask = ~df[col].isin(set(valid_us_states.values()).union(valid_ca_states.values()))
-            invalid_states = pd.concat([invalid_states, df[invalid_mask]], ignore_index=True)
-            df = df[~invalid_mask].copy()
+        df, invalid_states = _split_invalid_rows(
+            df,
+            state_columns,
+            normalize=lambda values: _map_distinct(values, extract_state).fillna('').astype('str'),
+            is_valid=lambda values: values.isin(_VALID_STATE_ABBREVIATIONS)
+        )
         log_message(f'[INFO] invalid_states found: {len(invalid_states)}')
         if len(invalid_states)>0 and upload_enabled:
             upload_to_s3(s3_client = s3_client,  data = invalid_states, bucket_name = s3_bucket_name + '-c', object_key = f"{df_name}_invalid_states.csv", CreateS3Bucket=True)
@@ -5947,58 +7755,89 @@ def clean_df(
 def extract_state(
     text
 ):
-    valid_states = {**valid_us_states, **valid_ca_states}
-    abbr_set = set(valid_states.values())
     if pd.isna(text):
         return text
     if not isinstance(text, str):
         return None
     s = str(text).strip().upper().replace('-',' ').replace('  ',' ')
-    for state, abbr in valid_states.items():
+    # First state name (in dictionary order) contained in the text wins, e.g. "WEST VIRGINIA" -> "VA"
+    for state, abbr in _VALID_STATES.items():
         if state in s:
             return abbr
     s = s.replace(' ','')
-    if s in abbr_set:
+    if s in _VALID_STATE_ABBREVIATIONS:
         return s
     return text
 
 
+def join_non_empty_columns(df, columns, sep, upper=False, strip=False, skip_blank=True):
+    # Column-at-a-time version of a row-wise sep.join; nulls are always skipped, blank strings only with skip_blank
+    parts = []
+    for col in columns:
+        present = df[col].notna()
+        values = df[col].fillna('').astype(str)
+        if upper:
+            # Vectorised upper() matches str.upper() only for ASCII (e.g. 'ß' -> 'SS'), so other columns use Python's
+            if values.str.isascii().all():
+                values = values.str.upper()
+            else:
+                values = values.astype(object).str.upper()
+        if strip:
+            values = values.str.strip()
+        if skip_blank:
+            present &= values.str.strip().ne('')
+        parts.append((present, values))
+    dtype = object if any(values.dtype == object for _, values in parts) else (parts[0][1].dtype if parts else object)
+    result = pd.Series('', index=df.index, dtype=dtype)
+    has_value = pd.Series(False, index=df.index)
+    for present, values in parts:
+        values = values.astype(dtype).where(present, '')
+        result = result.mask(present & has_value, result + sep) + values
+        has_value |= present
+    return result
+
+
+_ADDRESS_US_ZIP_PATTERN = re.compile(r'\b\d{5}\b')
+_ADDRESS_CA_ZIP_PATTERN = re.compile(r'[A-Za-z]\d[A-Za-z]\s?\d[A-Za-z]\d')
+_ADDRESS_STATE_NAME_PATTERN = re.compile(r'\b(' + '|'.join(re.escape(state) for state in _VALID_STATES.keys()) + r')\b', re.IGNORECASE)
+_ADDRESS_STATE_CODE_PATTERN = re.compile(r'\b[a-zA-Z]{2}\b')
+
+
+def extract_address_name_city_state_zip(
+    address
+):
+    address = str(address)
+    if address is None:
+        return None, None, None, None
+    try:
+        address = address.upper()
+        matches = _ADDRESS_US_ZIP_PATTERN.findall(address) or _ADDRESS_CA_ZIP_PATTERN.findall(address)
+        zip_code = matches[-1]
+        address = ''.join(re.split(zip_code, address)[:-1])
+        address = _ADDRESS_STATE_NAME_PATTERN.sub(lambda match: _VALID_STATES[match.group(0).upper()], address)
+        matches = _ADDRESS_STATE_CODE_PATTERN.findall(address)
+        state = matches[-1]
+        address = ''.join(re.split(state, address)[:-1])
+        city = [i for i in address.strip().split(',') if i != ''][-1].strip()
+        address = ''.join(re.split(city, address)[:-1])
+        ship_name = [i for i in address.strip().split(',') if i != ''][0].strip()
+        return ship_name, city, state, zip_code
+    except:
+        return None, None, None, None
+
+
 def clean_address(
     df
 ):
-    def extract_address_name_city_state_zip(address):
-        address = str(address)
-        if address is None:
-            return None, None, None, None 
-        try:
-            address = address.upper()
-            us_zip_pattern = r'\b\d{5}\b'
-            ca_zip_pattern = r'[A-Za-z]\d[A-Za-z]\s?\d[A-Za-z]\d'
-            matches = re.findall(us_zip_pattern, address) or re.findall(ca_zip_pattern, address)
-            zip_code = matches[-1]
-            address = ''.join(re.split(zip_code, address)[:-1])
-            valid_states = {**valid_us_states, **valid_ca_states}
-            state_pattern = re.compile(r'\b(' + '|'.join(re.escape(state) for state in valid_states.keys()) + r')\b', re.IGNORECASE)
-            address = state_pattern.sub(lambda match: valid_states[match.group(0).upper()], address)
-            state_pattern = r'\b[a-zA-Z]{2}\b'
-            matches = re.findall(state_pattern, address)
-            state = matches[-1]
-            address = ''.join(re.split(state, address)[:-1])
-            city = [i for i in address.strip().split(',') if i != ''][-1].strip()
-            address = ''.join(re.split(city, address)[:-1])
-            ship_name = [i for i in address.strip().split(',') if i != ''][0].strip()
-            return ship_name, city, state, zip_code
-        except:
-            return None, None, None, None 
 
     addresses = {'BillAddressBlockAddr':'billingAddress', 'ShipAddressBlockAddr':'ShippingAddress', 'BADDR':'billingAddress', 'SADDR':'ShippingAddress', 'ADDR':'Address'}
     for key, value in addresses.items():
         AddressCols = [i for i in df.columns if key in i]
         if AddressCols:
-            df[value] = df[AddressCols].agg(lambda x: ', '.join(x.dropna()), axis=1)
+            df[value] = join_non_empty_columns(df, AddressCols, ', ', skip_blank=False)
             df.drop(columns = AddressCols, inplace=True)
             if not df.empty:
-                df[[f'{value}Name', f'{value}City', f'{value}State', f'{value}Zip']] = df[value].apply(extract_address_name_city_state_zip).to_list()
+                df[[f'{value}Name', f'{value}City', f'{value}State', f'{value}Zip']] = _map_distinct(df[value], extract_address_name_city_state_zip).to_list()
             else:
                 df[[f'{value}Name', f'{value}City', f'{value}State', f'{value}Zip']] = None
     return df
@@ -6344,6 +8183,7 @@ def upload_to_redshift(
     createRedshiftCluster=False,
     max_allowed_length=870
 ):
+    require_modules('psycopg2', 'DuplicateObject', 'UndefinedTable')
     try:
         redshift_iam_role_arn = create_iam_role(iam_client, role_name, trust_policy)
         attach_policies_to_role(iam_client, role_name, role_policies)
@@ -6525,6 +8365,23 @@ def upload_to_redshift(
     log_message('[INFO] 🚀 Upload process completed.')
 
 
+STATUS_RULES = [
+    ("INVOICED", lambda d: d["InvoiceDate"].notna()),
+    ("INSTALLED", lambda d: d["InstallDate"].notna()),
+    ("LATE INSTALL", lambda d: d["PlannedInstallDate"].notna() & (d["PlannedInstallDate"] < pd.Timestamp(datetime.now().date()))),
+    ("LATE PLANNED INSTALL", lambda d:
+        d["PlannedInstallDate"].notna() &
+        d["ReqInstallDate"].notna() &
+        (d["ReqInstallDate"] < d["PlannedInstallDate"])
+    ),
+    ("PLANNED INSTALL", lambda d: d["PlannedInstallDate"].notna()),
+    ("SHIPPED", lambda d: d["ShipDate"].notna()),
+    ("LATE SHIP", lambda d: d["PlannedShipDate"].notna() & (d["PlannedShipDate"] < pd.Timestamp(datetime.now().date()))),
+    ("PLANNED SHIP", lambda d: d["PlannedShipDate"].notna()),
+    ("UNPLANNED SHIP", lambda d: True)
+]
+
+
 def get_status(
     row, 
     rules = [
@@ -6548,6 +8405,14 @@ def get_status(
             return status
 
 
+def get_status_frame(
+    df,
+    rules = STATUS_RULES
+):
+    # Vectorised get_status for a whole frame: rules are column predicates evaluated by apply_rules, first match wins
+    return apply_rules(df, rules)
+
+
 def find_date_columns(
     df, 
     sample_size=500, 